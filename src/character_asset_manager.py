@@ -6,6 +6,7 @@ Supports multiple playable characters including the Female Adventurer
 
 import pygame
 import json
+import hashlib
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Union
 from dataclasses import dataclass
@@ -33,6 +34,7 @@ class CharacterAssetManager:
         self.images = {}
         self.sprite_configs = {}
         self.processed_sprites = {}
+        self._surface_interner: Dict[bytes, pygame.Surface] = {}  # Pixel digest -> first surface with those pixels
         
         # Character definitions
         self.characters = {
@@ -254,7 +256,7 @@ class CharacterAssetManager:
                 # Convert PIL image to Pygame surface
                 frame_data = frame.tobytes()
                 pygame_surface = pygame.image.fromstring(frame_data, frame.size, 'RGBA')
-                frames.append(pygame_surface)
+                frames.append(self._intern_surface(pygame_surface, frame_data))
             
             return frames
             
@@ -262,6 +264,12 @@ class CharacterAssetManager:
             print(f"Error processing {image_path}: {e}")
             return self.create_placeholder_frames(config)
     
+    def _intern_surface(self, surface: pygame.Surface, rgba_data: bytes) -> pygame.Surface:
+        """Return a previously loaded surface with identical pixels, if any (frames are never modified)"""
+        digest = hashlib.blake2b(rgba_data, digest_size=16)
+        digest.update(repr(surface.get_size()).encode())
+        return self._surface_interner.setdefault(digest.digest(), surface)
+    
     def auto_crop_transparency(self, pil_image: Image.Image) -> Image.Image:
         """Remove transparent borders from sprite"""
         try:
@@ -5,9 +5,9 @@ Handles animated GIF loading and playback
 """
 
 import pygame
-from PIL import Image
+from PIL import Image, ImageSequence
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
 import time
 
 class AnimatedGIF:
@@ -21,38 +21,34 @@ class AnimatedGIF:
         self.frame_timer = 0.0
         self.total_frames = 0
         self.loaded = False
+        self._scaled_cache: Dict[tuple, List[pygame.Surface]] = {}
         
         self.load_gif()
     
     def load_gif(self):
         """Load GIF frames using PIL and convert to pygame surfaces"""
+        # Scaled frames belong to the previously loaded frames
+        self._scaled_cache.clear()
         try:
             # Open GIF with PIL
             pil_image = Image.open(self.gif_path)
             
-            frame_index = 0
-            while True:
-                try:
-                    # Seek to frame
-                    pil_image.seek(frame_index)
-                    
-                    # Convert PIL frame to pygame surface
-                    frame_data = pil_image.convert("RGBA")
-                    pygame_surface = pygame.image.fromstring(
-                        frame_data.tobytes(), frame_data.size, "RGBA"
-                    )
-                    
-                    self.frames.append(pygame_surface)
-                    
-                    # Get frame duration (default to 100ms if not available)
-                    duration = pil_image.info.get('duration', 100)
-                    self.frame_durations.append(duration)
-                    
-                    frame_index += 1
-                    
-                except EOFError:
-                    # End of frames
-                    break
+            convert_frames = pygame.display.get_surface() is not None
+            for frame in ImageSequence.Iterator(pil_image):
+                # Convert PIL frame to pygame surface; frombuffer wraps the
+                # RGBA bytes directly instead of copying them again
+                frame_data = frame.convert("RGBA")
+                pygame_surface = pygame.image.frombuffer(
+                    frame_data.tobytes(), frame_data.size, "RGBA"
+                )
+                # Match the display's pixel format once so blits don't convert every frame
+                if convert_frames:
+                    pygame_surface = pygame_surface.convert_alpha()
+                
+                self.frames.append(pygame_surface)
+                
+                # Get frame duration (default to 100ms if not available)
+                self.frame_durations.append(frame.info.get('duration', 100))
             
             self.total_frames = len(self.frames)
             self.loaded = True
@@ -83,11 +79,16 @@ class AnimatedGIF:
         return self.frames[self.current_frame]
     
     def get_scaled_surface(self, size: tuple) -> Optional[pygame.Surface]:
-        """Get current frame scaled to specified size"""
-        current_surface = self.get_current_surface()
-        if current_surface:
-            return pygame.transform.scale(current_surface, size)
-        return None
+        """Get current frame scaled to specified size (frames are scaled once per size)"""
+        if not self.loaded or not self.frames:
+            return None
+        
+        size = tuple(size)
+        scaled_frames = self._scaled_cache.get(size)
+        if scaled_frames is None:
+            scaled_frames = [pygame.transform.scale(frame, size) for frame in self.frames]
+            self._scaled_cache[size] = scaled_frames
+        return scaled_frames[self.current_frame]
     
     def reset(self):
         """Reset animation to first frame"""
@@ -6,6 +6,7 @@ Handles proper sprite extraction, cropping, and scaling for consistent gameplay
 
 import pygame
 import json
+import hashlib
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Union
 from dataclasses import dataclass
@@ -22,6 +23,7 @@ class SpriteConfig:
     crop_rect: Optional[Tuple[int, int, int, int]] = None  # (x, y, width, height)
     offset_x: int = 0
     offset_y: int = 0
+    auto_crop: bool = False  # Trim transparent borders (one shared box, so frames stay the same size)
 
 class ImprovedAssetManager:
     """Enhanced asset manager with proper sprite handling"""
@@ -31,6 +33,9 @@ class ImprovedAssetManager:
         self.images = {}
         self.sprite_configs = {}
         self.processed_sprites = {}
+        self.scaled_sprites = {}  # (sprite_key, size) -> frames scaled once on first request
+        self._sheet_cache: Dict[Path, pygame.Surface] = {}  # Sheets shared by several configs load once
+        self._surface_interner: Dict[bytes, pygame.Surface] = {}  # Pixel digest -> first surface with those pixels
         
         # Target dimensions for consistent gameplay
         self.TARGET_PLAYER_SIZE = (64, 64)
@@ -115,53 +120,53 @@ class ImprovedAssetManager:
             return self.create_placeholder_frames(config)
         
         try:
-            # Load image with PIL for better processing
-            pil_image = Image.open(image_path)
-            
-            # Convert to RGBA if needed
-            if pil_image.mode != 'RGBA':
-                pil_image = pil_image.convert('RGBA')
-            
-            frames = []
+            sheet = self._load_sheet(image_path)
+            sheet_rect = sheet.get_rect()
             
             # Calculate actual frame dimensions if auto-detecting
             if config.frame_width == -1:  # Auto-detect
-                config.frame_width = pil_image.width // config.frame_count
+                config.frame_width = sheet.get_width() // config.frame_count
             
+            frame_rects = []
             for i in range(config.frame_count):
                 # Extract frame from spritesheet
                 left = i * config.frame_width + config.offset_x
                 top = config.offset_y
-                right = left + config.frame_width
-                bottom = top + config.frame_height
-                
-                # Ensure we don't go out of bounds
-                if right > pil_image.width:
-                    right = pil_image.width
-                if bottom > pil_image.height:
-                    bottom = pil_image.height
-                
-                # Crop the frame
-                frame = pil_image.crop((left, top, right, bottom))
+                frame_rect = pygame.Rect(left, top, config.frame_width, config.frame_height)
                 
                 # Apply cropping if specified
                 if config.crop_rect:
                     cx, cy, cw, ch = config.crop_rect
-                    frame = frame.crop((cx, cy, cx + cw, cy + ch))
+                    frame_rect = frame_rect.clip(pygame.Rect(left + cx, top + cy, cw, ch))
                 
-                # Remove excess transparency (auto-crop)
-                frame = self.auto_crop_transparency(frame)
+                # Ensure we don't go out of bounds
+                frame_rects.append(frame_rect.clip(sheet_rect))
+            
+            # Remove excess transparency (auto-crop) with the same box for every
+            # frame so the animation doesn't jitter
+            if config.auto_crop:
+                bbox = self._uniform_bbox(sheet, frame_rects)
+                if bbox:
+                    frame_rects = [pygame.Rect(rect.x + bbox.x, rect.y + bbox.y, bbox.width, bbox.height).clip(rect)
+                                   for rect in frame_rects]
+            
+            convert_frames = pygame.display.get_surface() is not None
+            frames = []
+            for frame_rect in frame_rects:
+                frame = sheet.subsurface(frame_rect)
                 
-                # Scale the frame
+                # Scale the frame (scaling also copies it out of the sheet)
                 if config.scale_factor != 1.0:
-                    new_width = int(frame.width * config.scale_factor)
-                    new_height = int(frame.height * config.scale_factor)
-                    frame = frame.resize((new_width, new_height), Image.NEAREST)
+                    new_width = int(frame_rect.width * config.scale_factor)
+                    new_height = int(frame_rect.height * config.scale_factor)
+                    frame = pygame.transform.scale(frame, (new_width, new_height))
+                else:
+                    frame = frame.copy()
                 
-                # Convert PIL image to Pygame surface
-                frame_data = frame.tobytes()
-                pygame_surface = pygame.image.fromstring(frame_data, frame.size, 'RGBA')
-                frames.append(pygame_surface)
+                # Match the display's pixel format once so blits don't convert every frame
+                if convert_frames:
+                    frame = frame.convert_alpha()
+                frames.append(self._intern_surface(frame))
             
             return frames
             
@@ -169,17 +174,33 @@ class ImprovedAssetManager:
             print(f"Error processing {image_path}: {e}")
             return self.create_placeholder_frames(config)
     
-    def auto_crop_transparency(self, pil_image: Image.Image) -> Image.Image:
-        """Remove transparent borders from sprite"""
-        try:
-            # Get the bounding box of non-transparent pixels
-            bbox = pil_image.getbbox()
-            if bbox:
-                return pil_image.crop(bbox)
-            else:
-                return pil_image
-        except:
-            return pil_image
+    def _load_sheet(self, image_path: Path) -> pygame.Surface:
+        """Load a spritesheet as an RGBA pygame surface, once per path"""
+        sheet = self._sheet_cache.get(image_path)
+        if sheet is None:
+            # Load image with PIL for better processing; convert('RGBA') also
+            # expands palette ('P') images, so every sheet has one known layout
+            pil_image = Image.open(image_path).convert('RGBA')
+            # Frames are views into this surface instead of separate PIL crops and byte copies
+            sheet = pygame.image.frombuffer(pil_image.tobytes(), pil_image.size, 'RGBA')
+            self._sheet_cache[image_path] = sheet
+        return sheet
+    
+    def _intern_surface(self, surface: pygame.Surface) -> pygame.Surface:
+        """Return a previously loaded surface with identical pixels, if any (frames are never modified)"""
+        digest = hashlib.blake2b(pygame.image.tostring(surface, 'RGBA'), digest_size=16)
+        digest.update(repr(surface.get_size()).encode())
+        return self._surface_interner.setdefault(digest.digest(), surface)
+    
+    def _uniform_bbox(self, sheet: pygame.Surface, frame_rects: List[pygame.Rect]) -> Optional[pygame.Rect]:
+        """Get the union of the non-transparent bounding boxes of all frames, relative to each frame"""
+        bbox = None
+        for frame_rect in frame_rects:
+            frame_bbox = sheet.subsurface(frame_rect).get_bounding_rect()
+            if frame_bbox.width == 0 or frame_bbox.height == 0:
+                continue
+            bbox = frame_bbox if bbox is None else bbox.union(frame_bbox)
+        return bbox
     
     def create_placeholder_frames(self, config: SpriteConfig) -> List[pygame.Surface]:
         """Create placeholder frames when sprite loading fails"""
@@ -206,6 +227,9 @@ class ImprovedAssetManager:
         # Process background assets
         self.load_environment_assets()
         
+        # Frames are extracted; the decoded sheets are no longer needed
+        self._sheet_cache.clear()
+        
         print("✅ Asset processing complete!")
     
     def load_hero_sprites(self):
@@ -281,28 +305,24 @@ class ImprovedAssetManager:
             asset_path = castle_path / filename
             if asset_path.exists():
                 try:
-                    # Load and scale background to screen size
-                    pil_image = Image.open(asset_path)
+                    # Load straight into pygame; no PIL decode and byte round-trip
+                    image = pygame.image.load(str(asset_path))
+                    if pygame.display.get_surface() is not None:
+                        image = image.convert_alpha()
                     
                     # Scale backgrounds to fit screen while maintaining aspect ratio
                     screen_width, screen_height = 1280, 720
                     
                     # Calculate scaling to cover the screen
-                    scale_x = screen_width / pil_image.width
-                    scale_y = screen_height / pil_image.height
+                    scale_x = screen_width / image.get_width()
+                    scale_y = screen_height / image.get_height()
                     scale = max(scale_x, scale_y)  # Use max to cover screen
                     
-                    new_width = int(pil_image.width * scale)
-                    new_height = int(pil_image.height * scale)
+                    new_width = int(image.get_width() * scale)
+                    new_height = int(image.get_height() * scale)
                     
-                    scaled_image = pil_image.resize((new_width, new_height), Image.NEAREST)
-                    
-                    # Convert to pygame surface
-                    if scaled_image.mode != 'RGBA':
-                        scaled_image = scaled_image.convert('RGBA')
-                    
-                    image_data = scaled_image.tobytes()
-                    surface = pygame.image.fromstring(image_data, scaled_image.size, 'RGBA')
+                    # Nearest-neighbour keeps the pixel art crisp
+                    surface = pygame.transform.scale(image, (new_width, new_height))
                     
                     self.images[asset_key] = surface
                     print(f"  ✓ Processed {asset_key}: {new_width}x{new_height}")
@@ -330,9 +350,18 @@ class ImprovedAssetManager:
                 except Exception as e:
                     print(f"  ✗ Error processing {asset_key}: {e}")
     
-    def get_sprite_frames(self, sprite_key: str) -> List[pygame.Surface]:
-        """Get processed sprite frames"""
-        return self.processed_sprites.get(sprite_key, [])
+    def get_sprite_frames(self, sprite_key: str, size: Optional[Tuple[int, int]] = None) -> List[pygame.Surface]:
+        """Get processed sprite frames, optionally scaled to size"""
+        frames = self.processed_sprites.get(sprite_key, [])
+        if size is None or not frames:
+            return frames
+        
+        cache_key = (sprite_key, tuple(size))
+        scaled_frames = self.scaled_sprites.get(cache_key)
+        if scaled_frames is None:
+            scaled_frames = [pygame.transform.scale(frame, size) for frame in frames]
+            self.scaled_sprites[cache_key] = scaled_frames
+        return scaled_frames
     
     def get_image(self, image_key: str) -> Optional[pygame.Surface]:
         """Get processed image"""
@@ -7,10 +7,20 @@ A visual editor for creating custom levels
 import pygame
 import json
 import sys
+import functools
+import operator
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from array import array
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 from enum import Enum
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Initialize Pygame
 pygame.init()
 
@@ -20,6 +30,41 @@ SCREEN_HEIGHT = 720
 GRID_SIZE = 20
 FPS = 60
 
+# Spatial index settings for erase hit-testing
+WORLD_BOUNDS = (-8192, -8192, 16384, 16384)  # x, y, width, height covered by the quadtree
+QUADTREE_NODE_CAPACITY = 8
+QUADTREE_MAX_DEPTH = 8
+INDEX_MIN_OBJECTS = 64  # Below this a linear scan beats maintaining an index
+ENEMY_ERASE_TOLERANCE = 30
+CULL_INDEX_MIN_OBJECTS = 500  # Above this, viewport culling queries the quadtree
+ENEMY_DRAW_MARGIN = 40  # Enemy circle plus its type label around the enemy position
+TOMBSTONE_COMPACT_DIVISOR = 4  # Compact columns once more than 1/N of the rows are erased
+
+# Events that never affect what the editor shows; names missing from the installed pygame are skipped.
+# Expose/restore/resize events stay unblocked since they are what triggers a repaint while idle
+UNUSED_EVENT_NAMES = (
+    'ACTIVEEVENT', 'AUDIODEVICEADDED', 'WINDOWMOVED', 'WINDOWENTER', 'WINDOWLEAVE',
+)
+UNUSED_EVENTS = [getattr(pygame, name) for name in UNUSED_EVENT_NAMES if hasattr(pygame, name)]
+
+# Events after which the window contents are stale and must be repainted in full
+REPAINT_EVENT_NAMES = (
+    'VIDEOEXPOSE', 'WINDOWEXPOSED', 'WINDOWSHOWN', 'WINDOWRESTORED',
+    'WINDOWMAXIMIZED', 'WINDOWRESIZED', 'WINDOWSIZECHANGED',
+)
+REPAINT_EVENTS = frozenset(getattr(pygame, name) for name in REPAINT_EVENT_NAMES if hasattr(pygame, name))
+
+# Screen strip holding the cursor position readout, repainted on mouse motion
+CURSOR_INFO_RECT = pygame.Rect(0, SCREEN_HEIGHT - 30, SCREEN_WIDTH // 2, 30)
+
+# Help text shown under the mode indicator; the Grid/Snap and object count lines follow it
+STATIC_INSTRUCTIONS = (
+    "1: Platform Mode  2: Enemy Mode  3: Spawn Mode  4: Erase Mode",
+    "TAB: Cycle Enemy Type (in Enemy Mode)",
+    "G: Toggle Grid  S: Toggle Snap  Ctrl+S: Save  Ctrl+L: Load  Ctrl+C: Clear",
+    "Arrow Keys: Move Camera  Ctrl+G: Snap Level to Grid",
+)
+
 # Colors
 BLACK = (0, 0, 0)
 WHITE = (255, 255, 255)
@@ -32,6 +77,19 @@ YELLOW = (255, 255, 0)
 PURPLE = (128, 0, 128)
 GOLD = (255, 215, 0)
 
+# Color key for the empty space in the pre-rendered grid surface
+GRID_COLORKEY = (255, 0, 255)
+
+# Draw colors, converted to pygame.Color once instead of from tuples on every draw call
+PLATFORM_FILL = pygame.Color(100, 50, 0)
+PLATFORM_EDGE = pygame.Color(150, 75, 0)
+ENEMY_OUTLINE = pygame.Color(*WHITE)
+ENEMY_COLORS = {
+    'fire_skull': pygame.Color(*RED),
+    'demon': pygame.Color(*PURPLE),
+    'hell_hound': pygame.Color(100, 0, 0)
+}
+
 class EditMode(Enum):
     PLATFORM = "platform"
     ENEMY = "enemy"
@@ -43,26 +101,187 @@ class EnemyType(Enum):
     DEMON = "demon"
     HELL_HOUND = "hell_hound"
 
+class QuadTree:
+    """Point-query index over axis-aligned boxes (x, y, width, height)"""
+    
+    def __init__(self, x: int, y: int, width: int, height: int, depth: int = 0):
+        self.bounds = (x, y, width, height)
+        self.depth = depth
+        self.items = []  # (item_id, x, y, width, height)
+        self.children = None
+    
+    def insert(self, item_id: int, x: int, y: int, width: int, height: int):
+        """Insert a box into the deepest node that fully contains it"""
+        if self.children is not None:
+            child = self._child_containing(x, y, width, height)
+            if child is not None:
+                child.insert(item_id, x, y, width, height)
+                return
+        
+        self.items.append((item_id, x, y, width, height))
+        if (self.children is None and len(self.items) > QUADTREE_NODE_CAPACITY and
+                self.depth < QUADTREE_MAX_DEPTH):
+            self._split()
+    
+    def remove(self, item_id: int, x: int, y: int, width: int, height: int) -> bool:
+        """Remove a box inserted with the same id and bounds; returns whether it was found"""
+        item = (item_id, x, y, width, height)
+        node = self
+        while node is not None:
+            if item in node.items:
+                node.items.remove(item)
+                return True
+            if node.children is None:
+                return False
+            node = node._child_containing(x, y, width, height)
+        return False
+    
+    def query_rect(self, left: int, top: int, right: int, bottom: int) -> List[int]:
+        """Get ids of boxes that may overlap the given bounds (inclusive)"""
+        found = []
+        self._query(left, top, right, bottom, found)
+        return found
+    
+    def query_point(self, x: int, y: int) -> List[int]:
+        """Get ids of boxes that may contain the point"""
+        return self.query_rect(x, y, x, y)
+    
+    def _query(self, left: int, top: int, right: int, bottom: int, found: List[int]):
+        for item_id, x, y, width, height in self.items:
+            if x <= right and left <= x + width and y <= bottom and top <= y + height:
+                found.append(item_id)
+        if self.children is not None:
+            for child in self.children:
+                cx, cy, cw, ch = child.bounds
+                if cx <= right and left < cx + cw and cy <= bottom and top < cy + ch:
+                    child._query(left, top, right, bottom, found)
+    
+    def _child_containing(self, x: int, y: int, width: int, height: int) -> Optional['QuadTree']:
+        for child in self.children:
+            cx, cy, cw, ch = child.bounds
+            if cx <= x and x + width < cx + cw and cy <= y and y + height < cy + ch:
+                return child
+        return None
+    
+    def _split(self):
+        x, y, width, height = self.bounds
+        half_w = width // 2
+        half_h = height // 2
+        self.children = [
+            QuadTree(x, y, half_w, half_h, self.depth + 1),
+            QuadTree(x + half_w, y, width - half_w, half_h, self.depth + 1),
+            QuadTree(x, y + half_h, half_w, height - half_h, self.depth + 1),
+            QuadTree(x + half_w, y + half_h, width - half_w, height - half_h, self.depth + 1),
+        ]
+        
+        # Push items down into children that fully contain them
+        items = self.items
+        self.items = []
+        for item in items:
+            child = self._child_containing(*item[1:])
+            if child is not None:
+                child.insert(*item)
+            else:
+                self.items.append(item)
+
+def _spread_bits(v: int) -> int:
+    """Spread the low 16 bits of v so they occupy the even bit positions"""
+    v &= 0xFFFF
+    v = (v | (v << 8)) & 0x00FF00FF
+    v = (v | (v << 4)) & 0x0F0F0F0F
+    v = (v | (v << 2)) & 0x33333333
+    return (v | (v << 1)) & 0x55555555
+
+def morton_code(cell_x: int, cell_y: int) -> int:
+    """Interleave grid cell coordinates into one hash key (wraps every 65536 cells)"""
+    return _spread_bits(cell_x) | (_spread_bits(cell_y) << 1)
+
+def box_cells(x: int, y: int, width: int, height: int):
+    """Morton codes of every grid cell an edge-inclusive box touches"""
+    for cy in range(y // GRID_SIZE, (y + height) // GRID_SIZE + 1):
+        for cx in range(x // GRID_SIZE, (x + width) // GRID_SIZE + 1):
+            yield morton_code(cx, cy)
+
+# Fonts registered by id so rendered text can be memoized (Font objects are not hashable)
+_FONTS: Dict[int, pygame.font.Font] = {}
+
+def register_font(font: pygame.font.Font) -> int:
+    """Register a font for render_cached and return its id"""
+    font_id = len(_FONTS)
+    _FONTS[font_id] = font
+    return font_id
+
+@functools.lru_cache(maxsize=512)
+def render_cached(font_id: int, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+    """Render antialiased text with a registered font, reusing recent results"""
+    return _FONTS[font_id].render(text, True, color)
+
+def boxes_containing_point(xs: array, ys: array, widths: array, heights: array,
+                           candidates, x: int, y: int) -> List[int]:
+    """Indices of the candidate boxes that contain (x, y), edges included"""
+    return [i for i in candidates
+            if xs[i] <= x <= xs[i] + widths[i] and ys[i] <= y <= ys[i] + heights[i]]
+
+def boxes_overlapping_rect(xs: array, ys: array, widths: array, heights: array, candidates,
+                           left: int, top: int, right: int, bottom: int) -> List[int]:
+    """Indices of the candidate boxes touching the given rect, in candidate order"""
+    return [i for i in candidates
+            if xs[i] + widths[i] >= left and xs[i] <= right and ys[i] + heights[i] >= top and ys[i] <= bottom]
+
+def points_in_rect(xs: array, ys: array, candidates,
+                   left: int, top: int, right: int, bottom: int) -> List[int]:
+    """Indices of the candidate points inside the given rect, edges included"""
+    return [i for i in candidates if left <= xs[i] <= right and top <= ys[i] <= bottom]
+
 class LevelEditor:
     def __init__(self):
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("Reserka Gothic - Level Editor")
         self.clock = pygame.time.Clock()
         
+        # The editor never reads these, so let SDL drop them instead of queueing them
+        pygame.event.set_blocked(UNUSED_EVENTS)
+        
         # Editor state
         self.mode = EditMode.PLATFORM
         self.current_enemy = EnemyType.FIRE_SKULL
         self.grid_visible = True
         self.snap_to_grid = True
         
-        # Level data
-        self.platforms = []
-        self.enemies = []
+        # Level data, stored as parallel columns (one int array per field)
+        self.platform_x = array('i')
+        self.platform_y = array('i')
+        self.platform_width = array('i')
+        self.platform_height = array('i')
+        self.enemy_x = array('i')
+        self.enemy_y = array('i')
+        self.enemy_types: List[str] = []
         self.player_spawn = (100, 500)
         
+        # Spatial indexes for erase hit-testing. While an index exists, edits update it in
+        # place and erased rows become tombstones until the columns are compacted
+        self._platform_index: Optional[QuadTree] = None
+        self._enemy_index: Optional[QuadTree] = None
+        self._dead_platforms = set()
+        # Grid-cell hash of platforms (Morton code -> row ids) for point erase while snapping
+        self._platform_cells: Optional[Dict[int, List[int]]] = None
+        self._dead_enemies = set()
+        
         # UI
         self.font = pygame.font.Font(None, 24)
         self.small_font = pygame.font.Font(None, 18)
+        self._font_id = register_font(self.font)
+        self._small_font_id = register_font(self.small_font)
+        self._build_grid_surface()
+        
+        # Text that never changes is rendered once and blitted every frame
+        self._enemy_labels = {et.value: self.small_font.render(et.value, True, WHITE) for et in EnemyType}
+        self._spawn_label = self.font.render("SPAWN", True, WHITE)
+        self._instruction_surfs = [self.small_font.render(line, True, WHITE) for line in STATIC_INSTRUCTIONS]
+        self._status_state = None
+        self._status_surfs: List[pygame.Surface] = []
+        self._cursor_state = None
+        self._cursor_surface: Optional[pygame.Surface] = None
         
         # Mouse state
         self.mouse_pressed = False
@@ -73,6 +292,15 @@ class LevelEditor:
         self.camera_x = 0
         self.camera_y = 0
         
+        # Redraw tracking: nothing is drawn while idle; None means the whole screen changed
+        self.dirty = True
+        self._dirty_rects: Optional[List[pygame.Rect]] = None
+        
+        # Saves are written on a background thread so the editor keeps drawing
+        self._io_pool = ThreadPoolExecutor(max_workers=1)
+        # Pending saves, oldest first; each one is polled so no result is lost
+        self._save_futures: List[Future] = []
+        
     def snap_to_grid_pos(self, pos: Tuple[int, int]) -> Tuple[int, int]:
         """Snap position to grid if enabled"""
         x, y = pos
@@ -81,6 +309,32 @@ class LevelEditor:
             y = (y // GRID_SIZE) * GRID_SIZE
         return x, y
     
+    def _snap_bulk(self, xs: array, ys: array) -> Tuple[array, array]:
+        """Snap whole coordinate columns to the grid in one pass"""
+        return (array('i', [(x // GRID_SIZE) * GRID_SIZE for x in xs]),
+                array('i', [(y // GRID_SIZE) * GRID_SIZE for y in ys]))
+    
+    def snap_level_to_grid(self):
+        """Snap every platform and enemy onto the grid"""
+        self._compact_platforms()
+        self._compact_enemies()
+        
+        # Snap both corners of each platform, then rebuild its size as _normalize_rect does
+        xs, ys = self._snap_bulk(self.platform_x, self.platform_y)
+        far_xs, far_ys = self._snap_bulk(array('i', map(operator.add, self.platform_x, self.platform_width)),
+                                         array('i', map(operator.add, self.platform_y, self.platform_height)))
+        self.platform_width = array('i', [max(x1 - x0, GRID_SIZE) for x0, x1 in zip(xs, far_xs)])
+        self.platform_height = array('i', [max(y1 - y0, GRID_SIZE) for y0, y1 in zip(ys, far_ys)])
+        self.platform_x, self.platform_y = xs, ys
+        self.enemy_x, self.enemy_y = self._snap_bulk(self.enemy_x, self.enemy_y)
+        
+        # Every row moved, so the indexes are rebuilt on next use
+        self._platform_index = None
+        self._platform_cells = None
+        self._enemy_index = None
+        self.mark_dirty()
+        print("Level snapped to grid")
+    
     def world_to_screen(self, world_pos: Tuple[int, int]) -> Tuple[int, int]:
         """Convert world coordinates to screen coordinates"""
         x, y = world_pos
@@ -91,9 +345,33 @@ class LevelEditor:
         x, y = screen_pos
         return x + self.camera_x, y + self.camera_y
     
+    def mark_dirty(self, rect: Optional[pygame.Rect] = None):
+        """Request a redraw of rect (screen coordinates), or of the whole screen"""
+        if rect is None:
+            self._dirty_rects = None
+        elif self._dirty_rects is not None:
+            self._dirty_rects.append(rect)
+        self.dirty = True
+    
     def handle_events(self):
         """Handle pygame events"""
+        # Drain the queue once per frame; only the last mouse motion matters, so
+        # a burst of MOUSEMOTION events is coalesced into one
+        motion = None
         for event in pygame.event.get():
+            if event.type == pygame.MOUSEMOTION:
+                motion = event
+                continue
+            
+            if event.type in REPAINT_EVENTS:
+                # The window was uncovered, restored or resized: nothing changed in the
+                # editor, but idle frames skip drawing, so the full screen must be repainted
+                self.mark_dirty()
+                continue
+            
+            # Anything other than mouse motion may change editor state anywhere on screen
+            self.mark_dirty()
+            
             if event.type == pygame.QUIT:
                 return False
             
@@ -116,15 +394,18 @@ class LevelEditor:
                 
                 # Toggle options
                 elif event.key == pygame.K_g:
-                    self.grid_visible = not self.grid_visible
+                    if event.mod & pygame.KMOD_CTRL:
+                        self.snap_level_to_grid()
+                    else:
+                        self.grid_visible = not self.grid_visible
                 elif event.key == pygame.K_s:
-                    if pygame.key.get_pressed()[pygame.K_LCTRL]:
+                    if event.mod & pygame.KMOD_CTRL:
                         self.save_level()
                     else:
                         self.snap_to_grid = not self.snap_to_grid
-                elif event.key == pygame.K_l and pygame.key.get_pressed()[pygame.K_LCTRL]:
+                elif event.key == pygame.K_l and event.mod & pygame.KMOD_CTRL:
                     self.load_level()
-                elif event.key == pygame.K_c and pygame.key.get_pressed()[pygame.K_LCTRL]:
+                elif event.key == pygame.K_c and event.mod & pygame.KMOD_CTRL:
                     self.clear_level()
                 
                 # Camera movement
@@ -161,63 +442,223 @@ class LevelEditor:
                         self.add_platform(self.drag_start, world_pos)
                     self.drag_start = None
                     self.drag_end = None
-            
-            elif event.type == pygame.MOUSEMOTION:
-                if self.mouse_pressed and self.mode == EditMode.PLATFORM and self.drag_start:
-                    world_pos = self.screen_to_world(event.pos)
-                    self.drag_end = self.snap_to_grid_pos(world_pos)
+        
+        if motion is not None:
+            # Motion only moves the cursor readout and the drag preview
+            self.mark_dirty(CURSOR_INFO_RECT)
+            if self.mouse_pressed and self.mode == EditMode.PLATFORM and self.drag_start:
+                old_preview = self.get_drag_preview_rect()
+                world_pos = self.screen_to_world(motion.pos)
+                self.drag_end = self.snap_to_grid_pos(world_pos)
+                new_preview = self.get_drag_preview_rect()
+                for preview in (old_preview, new_preview):
+                    if preview is not None:
+                        self.mark_dirty(preview)
         
         return True
     
+    def _normalize_rect(self, a: Tuple[int, int], b: Tuple[int, int]) -> Tuple[int, int, int, int]:
+        """Rect spanning two corner points with positive size of at least one grid cell"""
+        return (min(a[0], b[0]), min(a[1], b[1]),
+                max(abs(b[0] - a[0]), GRID_SIZE), max(abs(b[1] - a[1]), GRID_SIZE))
+    
     def add_platform(self, start_pos: Tuple[int, int], end_pos: Tuple[int, int]):
         """Add a platform between two points"""
-        x1, y1 = start_pos
-        x2, y2 = end_pos
-        
-        # Ensure positive width and height
-        x = min(x1, x2)
-        y = min(y1, y2)
-        width = abs(x2 - x1)
-        height = abs(y2 - y1)
-        
-        # Minimum size
-        if width < GRID_SIZE:
-            width = GRID_SIZE
-        if height < GRID_SIZE:
-            height = GRID_SIZE
-        
-        self.platforms.append({
-            'x': x,
-            'y': y,
-            'width': width,
-            'height': height
-        })
+        x, y, width, height = self._normalize_rect(start_pos, end_pos)
+        self.platform_x.append(x)
+        self.platform_y.append(y)
+        self.platform_width.append(width)
+        self.platform_height.append(height)
+        if self._platform_index is not None:
+            self._platform_index.insert(len(self.platform_x) - 1, x, y, width, height)
+        if self._platform_cells is not None:
+            cells = self._platform_cells
+            for code in box_cells(x, y, width, height):
+                cells.setdefault(code, []).append(len(self.platform_x) - 1)
     
     def add_enemy(self, pos: Tuple[int, int]):
         """Add an enemy at the given position"""
         x, y = pos
-        self.enemies.append({
-            'x': x,
-            'y': y,
-            'type': self.current_enemy.value
-        })
+        self.enemy_x.append(x)
+        self.enemy_y.append(y)
+        self.enemy_types.append(self.current_enemy.value)
+        if self._enemy_index is not None:
+            self._enemy_index.insert(len(self.enemy_x) - 1, x, y, 0, 0)
+    
+    @property
+    def platforms(self) -> List[Dict[str, int]]:
+        """Platforms as dicts (the saved level format)"""
+        dead = self._dead_platforms
+        return [{'x': x, 'y': y, 'width': width, 'height': height}
+                for i, (x, y, width, height) in enumerate(zip(self.platform_x, self.platform_y,
+                                                              self.platform_width, self.platform_height))
+                if i not in dead]
+    
+    @property
+    def enemies(self) -> List[Dict]:
+        """Enemies as dicts (the saved level format)"""
+        dead = self._dead_enemies
+        return [{'x': x, 'y': y, 'type': enemy_type}
+                for i, (x, y, enemy_type) in enumerate(zip(self.enemy_x, self.enemy_y, self.enemy_types))
+                if i not in dead]
+    
+    @property
+    def platform_count(self) -> int:
+        """Number of platforms, not counting erased rows awaiting compaction"""
+        return len(self.platform_x) - len(self._dead_platforms)
+    
+    @property
+    def enemy_count(self) -> int:
+        """Number of enemies, not counting erased rows awaiting compaction"""
+        return len(self.enemy_x) - len(self._dead_enemies)
+    
+    def set_level_objects(self, platforms: List[Dict], enemies: List[Dict]):
+        """Replace all platforms and enemies from their dict form"""
+        self.platform_x = array('i', [p['x'] for p in platforms])
+        self.platform_y = array('i', [p['y'] for p in platforms])
+        self.platform_width = array('i', [p['width'] for p in platforms])
+        self.platform_height = array('i', [p['height'] for p in platforms])
+        self.enemy_x = array('i', [e['x'] for e in enemies])
+        self.enemy_y = array('i', [e['y'] for e in enemies])
+        self.enemy_types = [e['type'] for e in enemies]
+        self._platform_index = None
+        self._platform_cells = None
+        self._enemy_index = None
+        self._dead_platforms.clear()
+        self._dead_enemies.clear()
+    
+    def _compact_platforms(self):
+        """Drop tombstoned platform rows; ids shift, so the index is rebuilt on next use"""
+        dead = self._dead_platforms
+        if not dead:
+            return
+        keep = [i for i in range(len(self.platform_x)) if i not in dead]
+        for name in ('platform_x', 'platform_y', 'platform_width', 'platform_height'):
+            column = getattr(self, name)
+            setattr(self, name, array('i', [column[i] for i in keep]))
+        dead.clear()
+        self._platform_index = None
+        self._platform_cells = None
+    
+    def _compact_enemies(self):
+        """Drop tombstoned enemy rows; ids shift, so the index is rebuilt on next use"""
+        dead = self._dead_enemies
+        if not dead:
+            return
+        keep = [i for i in range(len(self.enemy_x)) if i not in dead]
+        ex, ey, enemy_types = self.enemy_x, self.enemy_y, self.enemy_types
+        self.enemy_x = array('i', [ex[i] for i in keep])
+        self.enemy_y = array('i', [ey[i] for i in keep])
+        self.enemy_types = [enemy_types[i] for i in keep]
+        dead.clear()
+        self._enemy_index = None
+    
+    def _live_rows(self, count: int, dead: set):
+        """Row ids 0..count-1 that have not been erased"""
+        if not dead:
+            return range(count)
+        return [i for i in range(count) if i not in dead]
+    
+    def _build_index(self, boxes, dead: set) -> QuadTree:
+        """Build a quadtree over (x, y, width, height) boxes, keyed by list index, skipping dead rows"""
+        index = QuadTree(*WORLD_BOUNDS)
+        for item_id, box in enumerate(boxes):
+            if item_id not in dead:
+                index.insert(item_id, *box)
+        return index
+    
+    def get_platform_index(self) -> QuadTree:
+        """Get the platform quadtree, building it if edits invalidated it"""
+        if self._platform_index is None:
+            self._platform_index = self._build_index(
+                zip(self.platform_x, self.platform_y, self.platform_width, self.platform_height),
+                self._dead_platforms)
+        return self._platform_index
+    
+    def get_platform_cells(self) -> Dict[int, List[int]]:
+        """Get the platform grid-cell hash, building it if edits invalidated it"""
+        if self._platform_cells is None:
+            cells: Dict[int, List[int]] = {}
+            dead = self._dead_platforms
+            for item_id, box in enumerate(zip(self.platform_x, self.platform_y,
+                                              self.platform_width, self.platform_height)):
+                if item_id in dead:
+                    continue
+                for code in box_cells(*box):
+                    cells.setdefault(code, []).append(item_id)
+            self._platform_cells = cells
+        return self._platform_cells
+    
+    def get_enemy_index(self) -> QuadTree:
+        """Get the enemy quadtree (enemies are points), building it if edits invalidated it"""
+        if self._enemy_index is None:
+            self._enemy_index = self._build_index(((x, y, 0, 0) for x, y in zip(self.enemy_x, self.enemy_y)),
+                                                 self._dead_enemies)
+        return self._enemy_index
     
     def erase_at_position(self, pos: Tuple[int, int]):
         """Erase objects at the given position"""
         x, y = pos
         
         # Remove platforms
-        self.platforms = [p for p in self.platforms 
-                         if not (p['x'] <= x <= p['x'] + p['width'] and 
-                                p['y'] <= y <= p['y'] + p['height'])]
+        if len(self.platform_x) < INDEX_MIN_OBJECTS:
+            self._compact_platforms()
+        px, py = self.platform_x, self.platform_y
+        pw, ph = self.platform_width, self.platform_height
+        if len(px) < INDEX_MIN_OBJECTS:
+            hits = boxes_containing_point(px, py, pw, ph, range(len(px)), x, y)
+            # Delete from the back so earlier indices stay valid
+            for i in sorted(hits, reverse=True):
+                for column in (px, py, pw, ph):
+                    del column[i]
+            if hits:
+                self._platform_index = None
+                self._platform_cells = None
+        else:
+            # With snapping on, clicks land on grid points, so one cell lookup finds the candidates
+            if self.snap_to_grid:
+                candidates = self.get_platform_cells().get(morton_code(x // GRID_SIZE, y // GRID_SIZE), ())
+            else:
+                candidates = self.get_platform_index().query_point(x, y)
+            
+            index, cells = self._platform_index, self._platform_cells
+            dead = self._dead_platforms
+            for i in boxes_containing_point(px, py, pw, ph, list(candidates), x, y):
+                if index is not None:
+                    index.remove(i, px[i], py[i], pw[i], ph[i])
+                if cells is not None:
+                    for code in box_cells(px[i], py[i], pw[i], ph[i]):
+                        cells[code].remove(i)
+                dead.add(i)
+            if len(dead) * TOMBSTONE_COMPACT_DIVISOR > len(px):
+                self._compact_platforms()
         
         # Remove enemies (with some tolerance)
-        tolerance = 30
-        self.enemies = [e for e in self.enemies
-                       if not (abs(e['x'] - x) <= tolerance and abs(e['y'] - y) <= tolerance)]
+        tolerance = ENEMY_ERASE_TOLERANCE
+        left, top, right, bottom = x - tolerance, y - tolerance, x + tolerance, y + tolerance
+        if len(self.enemy_x) < INDEX_MIN_OBJECTS:
+            self._compact_enemies()
+        ex, ey = self.enemy_x, self.enemy_y
+        if len(ex) < INDEX_MIN_OBJECTS:
+            hits = points_in_rect(ex, ey, range(len(ex)), left, top, right, bottom)
+            for i in sorted(hits, reverse=True):
+                del ex[i]
+                del ey[i]
+                del self.enemy_types[i]
+            if hits:
+                self._enemy_index = None
+        else:
+            index = self.get_enemy_index()
+            dead = self._dead_enemies
+            for i in points_in_rect(ex, ey, index.query_rect(left, top, right, bottom), left, top, right, bottom):
+                index.remove(i, ex[i], ey[i], 0, 0)
+                dead.add(i)
+            if len(dead) * TOMBSTONE_COMPACT_DIVISOR > len(ex):
+                self._compact_enemies()
     
     def save_level(self):
-        """Save the current level to a JSON file"""
+        """Save the current level to a JSON file in the background"""
+        # The properties build fresh lists, so the worker gets its own snapshot
         level_data = {
             'platforms': self.platforms,
             'enemies': self.enemies,
@@ -228,22 +669,56 @@ class LevelEditor:
         levels_dir.mkdir(exist_ok=True)
         
         filename = levels_dir / "custom_level.json"
-        with open(filename, 'w') as f:
-            json.dump(level_data, f, indent=2)
-        
-        print(f"Level saved to {filename}")
+        # The single worker writes queued saves in order, so the newest snapshot lands last
+        self._save_futures.append(self._io_pool.submit(self._write_level_file, filename, level_data))
+        self.mark_dirty()
+    
+    @staticmethod
+    def _write_level_file(filename: Path, level_data: Dict) -> Path:
+        """Serialize level data to filename (runs on the I/O thread)"""
+        if ORJSON_AVAILABLE:
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(level_data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filename, 'w') as f:
+                json.dump(level_data, f, indent=2)
+        return filename
+    
+    def poll_save(self):
+        """Report finished background saves in order and clear the saving indicator once none are pending"""
+        futures = self._save_futures
+        if not futures or not futures[0].done():
+            return
+        while futures and futures[0].done():
+            future = futures.pop(0)
+            error = future.exception()
+            if error is not None:
+                print(f"Error saving level: {error}")
+            else:
+                print(f"Level saved to {future.result()}")
+        self.mark_dirty()
+    
+    def wait_for_save(self):
+        """Block until every pending save has been written"""
+        if self._save_futures:
+            wait(self._save_futures)
+            self.poll_save()
     
     def load_level(self):
         """Load a level from a JSON file"""
+        self.wait_for_save()
         levels_dir = Path(__file__).parent.parent / "levels"
         filename = levels_dir / "custom_level.json"
         
         if filename.exists():
-            with open(filename, 'r') as f:
-                level_data = json.load(f)
+            if ORJSON_AVAILABLE:
+                with open(filename, 'rb') as f:
+                    level_data = orjson.loads(f.read())
+            else:
+                with open(filename, 'r') as f:
+                    level_data = json.load(f)
             
-            self.platforms = level_data.get('platforms', [])
-            self.enemies = level_data.get('enemies', [])
+            self.set_level_objects(level_data.get('platforms', []), level_data.get('enemies', []))
             self.player_spawn = tuple(level_data.get('player_spawn', (100, 500)))
             
             print(f"Level loaded from {filename}")
@@ -252,58 +727,88 @@ class LevelEditor:
     
     def clear_level(self):
         """Clear the current level"""
-        self.platforms.clear()
-        self.enemies.clear()
+        self.set_level_objects([], [])
         self.player_spawn = (100, 500)
         print("Level cleared")
     
+    def _build_grid_surface(self):
+        """Pre-render the grid pattern once; it is one cell larger than the screen so any camera offset is covered"""
+        width = SCREEN_WIDTH + GRID_SIZE
+        height = SCREEN_HEIGHT + GRID_SIZE
+        # Opaque and color-keyed rather than SRCALPHA, so the full-screen blit needs no per-pixel blending
+        self.grid_surf = pygame.Surface((width, height)).convert()
+        self.grid_surf.fill(GRID_COLORKEY)
+        
+        # Each axis is one serpentine polyline: the joining segments run along
+        # row/column 0 (itself a grid line) or just past the surface edge (clipped)
+        vertical = []
+        for i, x in enumerate(range(0, width, GRID_SIZE)):
+            ends = ((x, 0), (x, height)) if i % 2 == 0 else ((x, height), (x, 0))
+            vertical.extend(ends)
+        pygame.draw.lines(self.grid_surf, GRAY, False, vertical)
+        
+        horizontal = []
+        for i, y in enumerate(range(0, height, GRID_SIZE)):
+            ends = ((0, y), (width, y)) if i % 2 == 0 else ((width, y), (0, y))
+            horizontal.extend(ends)
+        pygame.draw.lines(self.grid_surf, GRAY, False, horizontal)
+        self.grid_surf.set_colorkey(GRID_COLORKEY, pygame.RLEACCEL)
+    
     def draw_grid(self):
         """Draw the editing grid"""
         if not self.grid_visible:
             return
         
-        # Calculate visible grid range
-        start_x = (self.camera_x // GRID_SIZE) * GRID_SIZE
-        start_y = (self.camera_y // GRID_SIZE) * GRID_SIZE
-        end_x = start_x + SCREEN_WIDTH + GRID_SIZE
-        end_y = start_y + SCREEN_HEIGHT + GRID_SIZE
-        
-        # Draw vertical lines
-        for x in range(start_x, end_x, GRID_SIZE):
-            screen_x = x - self.camera_x
-            pygame.draw.line(self.screen, GRAY, (screen_x, 0), (screen_x, SCREEN_HEIGHT))
-        
-        # Draw horizontal lines
-        for y in range(start_y, end_y, GRID_SIZE):
-            screen_y = y - self.camera_y
-            pygame.draw.line(self.screen, GRAY, (0, screen_y), (SCREEN_WIDTH, screen_y))
+        # Grid lines sit on world multiples of GRID_SIZE, so only the camera's
+        # offset within one cell matters
+        self.screen.blit(self.grid_surf, (-(self.camera_x % GRID_SIZE), -(self.camera_y % GRID_SIZE)))
     
     def draw_platforms(self):
-        """Draw all platforms"""
-        for platform in self.platforms:
-            screen_pos = self.world_to_screen((platform['x'], platform['y']))
-            rect = pygame.Rect(screen_pos[0], screen_pos[1], platform['width'], platform['height'])
-            pygame.draw.rect(self.screen, (100, 50, 0), rect)
-            pygame.draw.rect(self.screen, (150, 75, 0), rect, 2)
+        """Draw all platforms on screen"""
+        view_left, view_top = self.camera_x, self.camera_y
+        view_right, view_bottom = view_left + SCREEN_WIDTH, view_top + SCREEN_HEIGHT
+        
+        px, py = self.platform_x, self.platform_y
+        pw, ph = self.platform_width, self.platform_height
+        if len(px) > CULL_INDEX_MIN_OBJECTS:
+            # Keep list order so overlapping platforms stack the same way
+            candidates = sorted(self.get_platform_index().query_rect(view_left, view_top, view_right, view_bottom))
+        else:
+            candidates = self._live_rows(len(px), self._dead_platforms)
+        
+        # The camera offset is the view origin, so screen rects are built directly from it
+        screen, draw_rect, Rect = self.screen, pygame.draw.rect, pygame.Rect
+        for i in boxes_overlapping_rect(px, py, pw, ph, candidates, view_left, view_top, view_right, view_bottom):
+            rect = Rect(px[i] - view_left, py[i] - view_top, pw[i], ph[i])
+            draw_rect(screen, PLATFORM_FILL, rect)
+            draw_rect(screen, PLATFORM_EDGE, rect, 2)
     
     def draw_enemies(self):
         """Draw all enemies"""
-        enemy_colors = {
-            'fire_skull': RED,
-            'demon': PURPLE,
-            'hell_hound': (100, 0, 0)
-        }
+        view_left = self.camera_x - ENEMY_DRAW_MARGIN
+        view_top = self.camera_y - ENEMY_DRAW_MARGIN
+        view_right = self.camera_x + SCREEN_WIDTH + ENEMY_DRAW_MARGIN
+        view_bottom = self.camera_y + SCREEN_HEIGHT + ENEMY_DRAW_MARGIN
+        
+        ex, ey, enemy_types = self.enemy_x, self.enemy_y, self.enemy_types
+        if len(ex) > CULL_INDEX_MIN_OBJECTS:
+            candidates = sorted(self.get_enemy_index().query_rect(view_left, view_top, view_right, view_bottom))
+        else:
+            candidates = self._live_rows(len(ex), self._dead_enemies)
         
-        for enemy in self.enemies:
-            screen_pos = self.world_to_screen((enemy['x'], enemy['y']))
-            color = enemy_colors.get(enemy['type'], WHITE)
+        # Skip enemies whose circle and label are entirely off screen
+        for i in points_in_rect(ex, ey, candidates, view_left, view_top, view_right, view_bottom):
+            screen_pos = self.world_to_screen((ex[i], ey[i]))
+            color = ENEMY_COLORS.get(enemy_types[i], ENEMY_OUTLINE)
             
             # Draw enemy as a circle
             pygame.draw.circle(self.screen, color, screen_pos, 15)
-            pygame.draw.circle(self.screen, WHITE, screen_pos, 15, 2)
+            pygame.draw.circle(self.screen, ENEMY_OUTLINE, screen_pos, 15, 2)
             
             # Draw enemy type text
-            text = self.small_font.render(enemy['type'], True, WHITE)
+            text = self._enemy_labels.get(enemy_types[i])
+            if text is None:
+                text = self._enemy_labels[enemy_types[i]] = self.small_font.render(enemy_types[i], True, WHITE)
             text_rect = text.get_rect(center=(screen_pos[0], screen_pos[1] + 25))
             self.screen.blit(text, text_rect)
     
@@ -313,28 +818,21 @@ class LevelEditor:
         pygame.draw.circle(self.screen, GREEN, screen_pos, 20)
         pygame.draw.circle(self.screen, WHITE, screen_pos, 20, 3)
         
-        text = self.font.render("SPAWN", True, WHITE)
+        text = self._spawn_label
         text_rect = text.get_rect(center=(screen_pos[0], screen_pos[1] + 35))
         self.screen.blit(text, text_rect)
     
+    def get_drag_preview_rect(self) -> Optional[pygame.Rect]:
+        """Get the screen rect of the platform being dragged, if any"""
+        if self.drag_start and self.drag_end and self.mode == EditMode.PLATFORM:
+            return pygame.Rect(self._normalize_rect(self.world_to_screen(self.drag_start),
+                                                    self.world_to_screen(self.drag_end)))
+        return None
+    
     def draw_drag_preview(self):
         """Draw preview of platform being dragged"""
-        if self.drag_start and self.drag_end and self.mode == EditMode.PLATFORM:
-            x1, y1 = self.world_to_screen(self.drag_start)
-            x2, y2 = self.world_to_screen(self.drag_end)
-            
-            x = min(x1, x2)
-            y = min(y1, y2)
-            width = abs(x2 - x1)
-            height = abs(y2 - y1)
-            
-            # Minimum size
-            if width < GRID_SIZE:
-                width = GRID_SIZE
-            if height < GRID_SIZE:
-                height = GRID_SIZE
-            
-            rect = pygame.Rect(x, y, width, height)
+        rect = self.get_drag_preview_rect()
+        if rect is not None:
             pygame.draw.rect(self.screen, YELLOW, rect, 2)
     
     def draw_ui(self):
@@ -344,32 +842,42 @@ class LevelEditor:
         if self.mode == EditMode.ENEMY:
             mode_text += f" ({self.current_enemy.value})"
         
-        mode_surface = self.font.render(mode_text, True, WHITE)
+        mode_surface = render_cached(self._font_id, mode_text, WHITE)
         self.screen.blit(mode_surface, (10, 10))
         
         # Instructions
-        instructions = [
-            "1: Platform Mode  2: Enemy Mode  3: Spawn Mode  4: Erase Mode",
-            "TAB: Cycle Enemy Type (in Enemy Mode)",
-            "G: Toggle Grid  S: Toggle Snap  Ctrl+S: Save  Ctrl+L: Load  Ctrl+C: Clear",
-            "Arrow Keys: Move Camera",
-            f"Grid: {'ON' if self.grid_visible else 'OFF'}  Snap: {'ON' if self.snap_to_grid else 'OFF'}",
-            f"Objects: {len(self.platforms)} platforms, {len(self.enemies)} enemies"
-        ]
+        for i, text_surface in enumerate(self._instruction_surfs):
+            self.screen.blit(text_surface, (10, 40 + i * 20))
         
-        for i, instruction in enumerate(instructions):
-            text_surface = self.small_font.render(instruction, True, WHITE)
+        # Status lines are only re-rendered when the state they show changes
+        status_state = (self.grid_visible, self.snap_to_grid, self.platform_count, self.enemy_count)
+        if status_state != self._status_state:
+            self._status_state = status_state
+            status_lines = [
+                f"Grid: {'ON' if self.grid_visible else 'OFF'}  Snap: {'ON' if self.snap_to_grid else 'OFF'}",
+                f"Objects: {self.platform_count} platforms, {self.enemy_count} enemies"
+            ]
+            self._status_surfs = [render_cached(self._small_font_id, line, WHITE) for line in status_lines]
+        
+        first_row = len(self._instruction_surfs)
+        for i, text_surface in enumerate(self._status_surfs, first_row):
             self.screen.blit(text_surface, (10, 40 + i * 20))
         
-        # Mode-specific cursor info
-        mouse_pos = pygame.mouse.get_pos()
-        world_pos = self.screen_to_world(mouse_pos)
-        if self.snap_to_grid:
-            world_pos = self.snap_to_grid_pos(world_pos)
+        # Mode-specific cursor info, recomputed only when the mouse, camera or snapping changed
+        cursor_state = (pygame.mouse.get_pos(), self.camera_x, self.camera_y, self.snap_to_grid)
+        if cursor_state != self._cursor_state:
+            self._cursor_state = cursor_state
+            world_pos = self.screen_to_world(cursor_state[0])
+            if self.snap_to_grid:
+                world_pos = self.snap_to_grid_pos(world_pos)
+            
+            cursor_info = f"World: ({world_pos[0]}, {world_pos[1]})"
+            self._cursor_surface = render_cached(self._small_font_id, cursor_info, WHITE)
+        self.screen.blit(self._cursor_surface, (10, SCREEN_HEIGHT - 30))
         
-        cursor_info = f"World: ({world_pos[0]}, {world_pos[1]})"
-        cursor_surface = self.small_font.render(cursor_info, True, WHITE)
-        self.screen.blit(cursor_surface, (10, SCREEN_HEIGHT - 30))
+        if self._save_futures:
+            saving_surface = render_cached(self._font_id, "Saving...", YELLOW)
+            self.screen.blit(saving_surface, saving_surface.get_rect(topright=(SCREEN_WIDTH - 10, 10)))
     
     def draw(self):
         """Draw the entire editor"""
@@ -389,16 +897,37 @@ class LevelEditor:
         # Draw UI
         self.draw_ui()
         
-        pygame.display.flip()
+        self.present()
+    
+    def present(self):
+        """Push the frame to the display, updating only the dirty rects when they are small"""
+        rects = self._dirty_rects
+        if rects is not None:
+            # Rect-list updates only pay off while the dirty area is well under the full screen
+            dirty_area = sum(rect.width * rect.height for rect in rects)
+            if dirty_area * 2 > SCREEN_WIDTH * SCREEN_HEIGHT:
+                rects = None
+        
+        if rects is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(rects)
+        
+        self.dirty = False
+        self._dirty_rects = []
     
     def run(self):
         """Main editor loop"""
         running = True
         while running:
             running = self.handle_events()
-            self.draw()
+            self.poll_save()
+            if self.dirty:
+                self.draw()
             self.clock.tick(FPS)
         
+        self.wait_for_save()
+        self._io_pool.shutdown()
         pygame.quit()
         sys.exit()
 
@@ -7,15 +7,79 @@ Includes loading screen, title menu, settings, pause menu, and transitions
 import pygame
 import json
 import math
+import os
 import time
+import functools
+import operator
+from array import array
 from enum import Enum
 from pathlib import Path
 from typing import Dict, List, Optional, Callable, Any
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 # Import GIF support
 from gif_loader import GIFManager
 
+# Fonts are created once per size and shared by every menu
+_FONT_CACHE: Dict[int, pygame.font.Font] = {}
+
+def get_font(size: int) -> pygame.font.Font:
+    """Get the default font at the given size, creating it on first use"""
+    font = _FONT_CACHE.get(size)
+    if font is None:
+        font = _FONT_CACHE[size] = pygame.font.Font(None, size)
+    return font
+
+@functools.lru_cache(maxsize=256)
+def render_cached(size: int, text: str, color: tuple) -> pygame.Surface:
+    """Render antialiased text in the default font, reusing recently rendered surfaces"""
+    return get_font(size).render(text, True, color)
+
+@functools.lru_cache(maxsize=None)
+def get_glow_surface(width: int, height: int) -> pygame.Surface:
+    """Get the translucent hover glow for a button of the given padded size"""
+    glow = pygame.Surface((width, height), pygame.SRCALPHA)
+    glow.fill((120, 100, 150, 100))
+    return glow
+
+def create_dim_overlay() -> pygame.Surface:
+    """Create the full-screen translucent black layer drawn behind menus"""
+    overlay = pygame.Surface((1280, 720), pygame.SRCALPHA)
+    overlay.fill((0, 0, 0, 180))
+    return overlay
+
+# Surface.fblits is a pygame-ce API; with pygame, blits(..., doreturn=False) is the path used
+_HAS_FBLITS = hasattr(pygame.Surface, 'fblits')
+
+def blit_batch(target: pygame.Surface, sequence: List[tuple]):
+    """Blit a list of (surface, dest) pairs onto target in a single call"""
+    if _HAS_FBLITS:
+        target.fblits(sequence)
+    else:
+        target.blits(sequence, doreturn=False)
+
+# Loading bar size, and how many shimmer phases of its gradient are pre-rendered
+PROGRESS_BAR_WIDTH = 400
+PROGRESS_BAR_HEIGHT = 20
+GRADIENT_PHASES = 16
+
+# Sine lookup table for menu animations, indexed by phase in 1/SIN_LUT_SIZE turns
+SIN_LUT_SIZE = 1024
+_SIN_LUT = array('f', [math.sin(i * 2 * math.pi / SIN_LUT_SIZE) for i in range(SIN_LUT_SIZE)])
+_SIN_LUT_SCALE = SIN_LUT_SIZE / (2 * math.pi)
+
+def fast_sin(x: float) -> float:
+    """Table-driven sine, accurate to about 0.006, for animation offsets"""
+    return _SIN_LUT[int(x * _SIN_LUT_SCALE) & (SIN_LUT_SIZE - 1)]
+
+# Seconds without slider changes before settings are written to disk
+SETTINGS_SAVE_DELAY = 0.25
+
+# Changed controls above which a menu repaints everything instead of individual rects
+DIRTY_RECT_LIMIT = 4
+# Room reserved right of a slider for its value label
+SLIDER_VALUE_WIDTH = 80
+
 class MenuState(Enum):
     LOADING = "loading"
     MAIN_MENU = "main_menu"
@@ -34,12 +98,19 @@ class MenuButton:
     action: Callable
     enabled: bool = True
     hover: bool = False
+    # Geometry is fixed once created (menus rebuild their buttons to change it)
+    rect: pygame.Rect = field(init=False, repr=False, compare=False)
+    center: tuple = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.rect = pygame.Rect(self.x, self.y, self.width, self.height)
+        self.center = self.rect.center
     
     def get_rect(self) -> pygame.Rect:
-        return pygame.Rect(self.x, self.y, self.width, self.height)
+        return self.rect
     
     def is_clicked(self, pos: tuple) -> bool:
-        return self.get_rect().collidepoint(pos) and self.enabled
+        return self.rect.collidepoint(pos) and self.enabled
 
 @dataclass
 class MenuSlider:
@@ -51,20 +122,59 @@ class MenuSlider:
     max_value: float
     value: float
     callback: Callable[[float], None]
+    # Geometry is fixed once created; only the handle moves, so its rect is updated in place
+    rect: pygame.Rect = field(init=False, repr=False, compare=False)
+    track_rect: pygame.Rect = field(init=False, repr=False, compare=False)
+    handle_rect: pygame.Rect = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.rect = pygame.Rect(self.x, self.y, self.width, 30)
+        self.track_rect = pygame.Rect(self.x, self.y + 10, self.width, 10)
+        self.handle_rect = pygame.Rect(0, self.y + 5, 16, 20)
     
     def get_rect(self) -> pygame.Rect:
-        return pygame.Rect(self.x, self.y, self.width, 30)
+        return self.rect
     
     def get_handle_pos(self) -> int:
         ratio = (self.value - self.min_value) / (self.max_value - self.min_value)
         return int(self.x + ratio * self.width)
 
+class ConvertedAssets:
+    """Asset manager surfaces converted to the display pixel format on first use"""
+    
+    def __init__(self, asset_manager):
+        self.asset_manager = asset_manager
+        self.surfaces: Dict[tuple, pygame.Surface] = {}
+    
+    def ui_element(self, element_id: str, alpha: bool = False) -> Optional[pygame.Surface]:
+        return self._get(('ui', element_id), self.asset_manager.get_ui_element, element_id, alpha)
+    
+    def environment(self, env_id: str, alpha: bool = True) -> Optional[pygame.Surface]:
+        return self._get(('environment', env_id), self.asset_manager.get_environment, env_id, alpha)
+    
+    def _get(self, key: tuple, fetch: Callable, name: str, alpha: bool) -> Optional[pygame.Surface]:
+        surface = self.surfaces.get(key)
+        if surface is None:
+            surface = fetch(name)
+            # Missing assets and surfaces fetched before the display exists are not cached
+            if surface is not None and pygame.display.get_surface() is not None:
+                surface = surface.convert_alpha() if alpha else surface.convert()
+                self.surfaces[key] = surface
+        return surface
+
+def button_index_at(button_rects: List[pygame.Rect], pos: tuple) -> int:
+    """Index of the first button rect containing pos, or -1"""
+    return pygame.Rect(pos, (1, 1)).collidelist(button_rects)
+
 class LoadingScreen:
     """Animated loading screen with progress bar"""
     
+    PARTICLE_COLORS = ((100, 150, 255), (150, 100, 255), (255, 150, 100))
+    
     def __init__(self, screen: pygame.Surface, asset_manager):
         self.screen = screen
         self.asset_manager = asset_manager
+        self.assets = ConvertedAssets(asset_manager)
         self.progress = 0.0
         self.loading_text = "Loading Reserka Gothic..."
         self.loading_stages = [
@@ -78,22 +188,64 @@ class LoadingScreen:
         ]
         self.current_stage = 0
         self.animation_time = 0
-        self.particles = []
+        # Particles are stored as parallel columns: position, velocity and shared sprite
+        self.particle_x = array('d')
+        self.particle_y = array('d')
+        self.particle_dx = array('d')
+        self.particle_dy = array('d')
+        self.particle_surfaces: List[pygame.Surface] = []
+        self.particle_sprites: Dict[tuple, pygame.Surface] = {}
+        self.gradient_frames: Dict[int, pygame.Surface] = {}
+        self.bar_background = self.create_bar_background()
         self.create_particles()
     
     def create_particles(self):
         """Create animated particles for loading screen"""
         import random
         for i in range(30):
-            particle = {
-                'x': random.randint(0, 1280),
-                'y': random.randint(0, 720),
-                'dx': random.uniform(-1, 1),
-                'dy': random.uniform(-1, 1),
-                'size': random.randint(1, 3),
-                'color': random.choice([(100, 150, 255), (150, 100, 255), (255, 150, 100)])
-            }
-            self.particles.append(particle)
+            self.particle_x.append(random.randint(0, 1280))
+            self.particle_y.append(random.randint(0, 720))
+            self.particle_dx.append(random.uniform(-1, 1))
+            self.particle_dy.append(random.uniform(-1, 1))
+            size = random.randint(1, 3)
+            color = random.choice(self.PARTICLE_COLORS)
+            self.particle_surfaces.append(self.get_particle_sprite(color, size))
+    
+    def get_particle_sprite(self, color: tuple, size: int) -> pygame.Surface:
+        """Get the shared circle sprite for a particle color and size, drawing it once"""
+        key = (color, size)
+        sprite = self.particle_sprites.get(key)
+        if sprite is None:
+            sprite = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, color, (size, size), size)
+            self.particle_sprites[key] = sprite
+        return sprite
+    
+    def create_bar_background(self) -> pygame.Surface:
+        """Render the empty progress bar with its border"""
+        background = pygame.Surface((PROGRESS_BAR_WIDTH, PROGRESS_BAR_HEIGHT))
+        bar_rect = (0, 0, PROGRESS_BAR_WIDTH, PROGRESS_BAR_HEIGHT)
+        pygame.draw.rect(background, (50, 50, 50), bar_rect)
+        pygame.draw.rect(background, (100, 100, 100), bar_rect, 2)
+        return background
+    
+    def get_gradient_frame(self, phase_index: int) -> pygame.Surface:
+        """Get the full-width progress gradient for one shimmer phase, rendering it once"""
+        frame = self.gradient_frames.get(phase_index)
+        if frame is None:
+            # One pixel taller than the bar: the lines used to include their end point
+            frame = pygame.Surface((PROGRESS_BAR_WIDTH, PROGRESS_BAR_HEIGHT + 1))
+            phase = phase_index * 2 * math.pi / GRADIENT_PHASES
+            for i in range(PROGRESS_BAR_WIDTH):
+                ratio = i / PROGRESS_BAR_WIDTH
+                color_intensity = int(100 + 155 * ratio + 50 * fast_sin(phase + ratio * 10))
+                # Clamp color values to valid range 0-255
+                r = max(0, min(255, color_intensity))
+                g = max(0, min(255, color_intensity // 2))
+                b = max(0, min(255, 255 - color_intensity // 2))
+                pygame.draw.line(frame, (r, g, b), (i, 0), (i, PROGRESS_BAR_HEIGHT))
+            self.gradient_frames[phase_index] = frame
+        return frame
     
     def update(self, dt: float, progress: float):
         """Update loading screen with progress"""
@@ -104,102 +256,97 @@ class LoadingScreen:
         stage_index = int(self.progress * len(self.loading_stages))
         self.current_stage = min(stage_index, len(self.loading_stages) - 1)
         
-        # Update particles
-        for particle in self.particles:
-            particle['x'] += particle['dx']
-            particle['y'] += particle['dy']
-            
-            # Wrap particles around screen
-            if particle['x'] < 0:
-                particle['x'] = 1280
-            elif particle['x'] > 1280:
-                particle['x'] = 0
-                
-            if particle['y'] < 0:
-                particle['y'] = 720
-            elif particle['y'] > 720:
-                particle['y'] = 0
+        # Update particles a column at a time, wrapping them around the screen
+        self.particle_x = array('d', [1280 if x < 0 else 0 if x > 1280 else x
+                                      for x in map(operator.add, self.particle_x, self.particle_dx)])
+        self.particle_y = array('d', [720 if y < 0 else 0 if y > 720 else y
+                                      for y in map(operator.add, self.particle_y, self.particle_dy)])
     
     def draw(self):
         """Draw loading screen"""
         # Background
-        bg = self.asset_manager.get_ui_element('main_menu_bg')
+        bg = self.assets.ui_element('main_menu_bg')
         if bg:
             self.screen.blit(bg, (0, 0))
         else:
             self.screen.fill((15, 15, 25))
         
         # Draw particles
-        for particle in self.particles:
-            alpha = int(128 + 127 * math.sin(self.animation_time * 2 + particle['x'] * 0.01))
-            color = particle['color']
-            particle_surface = pygame.Surface((particle['size'] * 2, particle['size'] * 2), pygame.SRCALPHA)
-            pygame.draw.circle(particle_surface, color, 
-                             (particle['size'], particle['size']), particle['size'])
-            self.screen.blit(particle_surface, (particle['x'], particle['y']))
+        blit_batch(self.screen, list(zip(self.particle_surfaces, zip(self.particle_x, self.particle_y))))
         
         # Logo
-        logo = self.asset_manager.get_ui_element('reserka_logo')
+        logo = self.assets.ui_element('reserka_logo', alpha=True)
         if logo:
             logo_rect = logo.get_rect(center=(640, 200))
             self.screen.blit(logo, logo_rect)
         
         # Loading text
-        font_large = pygame.font.Font(None, 48)
-        font_small = pygame.font.Font(None, 32)
-        
-        loading_surface = font_large.render(self.loading_text, True, (255, 255, 255))
+        loading_surface = render_cached(48, self.loading_text, (255, 255, 255))
         loading_rect = loading_surface.get_rect(center=(640, 350))
         self.screen.blit(loading_surface, loading_rect)
         
         # Current stage
         if self.current_stage < len(self.loading_stages):
             stage_text = self.loading_stages[self.current_stage]
-            stage_surface = font_small.render(stage_text, True, (200, 200, 200))
+            stage_surface = render_cached(32, stage_text, (200, 200, 200))
             stage_rect = stage_surface.get_rect(center=(640, 400))
             self.screen.blit(stage_surface, stage_rect)
         
         # Progress bar
-        bar_width = 400
-        bar_height = 20
+        bar_width = PROGRESS_BAR_WIDTH
+        bar_height = PROGRESS_BAR_HEIGHT
         bar_x = 640 - bar_width // 2
         bar_y = 450
         
-        # Background
-        pygame.draw.rect(self.screen, (50, 50, 50), (bar_x, bar_y, bar_width, bar_height))
-        pygame.draw.rect(self.screen, (100, 100, 100), (bar_x, bar_y, bar_width, bar_height), 2)
+        # Background and border
+        self.screen.blit(self.bar_background, (bar_x, bar_y))
         
         # Progress fill
         fill_width = int(bar_width * self.progress)
         if fill_width > 0:
-            # Animated gradient
-            for i in range(fill_width):
-                ratio = i / bar_width
-                color_intensity = int(100 + 155 * ratio + 50 * math.sin(self.animation_time * 3 + ratio * 10))
-                # Clamp color values to valid range 0-255
-                r = max(0, min(255, color_intensity))
-                g = max(0, min(255, color_intensity // 2))
-                b = max(0, min(255, 255 - color_intensity // 2))
-                color = (r, g, b)
-                pygame.draw.line(self.screen, color, 
-                               (bar_x + i, bar_y), (bar_x + i, bar_y + bar_height))
+            # Animated gradient, shimmering through pre-rendered phases
+            phase_index = int(self.animation_time * 3 * GRADIENT_PHASES / (2 * math.pi)) % GRADIENT_PHASES
+            gradient = self.get_gradient_frame(phase_index)
+            self.screen.blit(gradient, (bar_x, bar_y), (0, 0, fill_width, bar_height + 1))
         
         # Progress percentage
         percent_text = f"{int(self.progress * 100)}%"
-        percent_surface = font_small.render(percent_text, True, (255, 255, 255))
+        percent_surface = render_cached(32, percent_text, (255, 255, 255))
         percent_rect = percent_surface.get_rect(center=(640, 500))
         self.screen.blit(percent_surface, percent_rect)
 
 class MainMenu:
     """Main menu with animated background and buttons"""
     
+    # Button colors
+    COLOR_HOVER = (80, 60, 100)
+    COLOR_IDLE = (60, 40, 80)
+    COLOR_BORDER = (100, 80, 120)
+    TEXT_HOVER = (255, 255, 255)
+    TEXT_IDLE = (200, 200, 200)
+    
     def __init__(self, screen: pygame.Surface, asset_manager):
         self.screen = screen
         self.asset_manager = asset_manager
+        self.assets = ConvertedAssets(asset_manager)
         self.buttons = []
         self.animation_time = 0
+        self.dim_overlay = create_dim_overlay()
+        self.cave_strip = None
+        self.cave_strip_source = None
         self.create_buttons()
     
+    def get_cave_strip(self, cave_bg: pygame.Surface) -> pygame.Surface:
+        """Get cave_bg tiled twice side by side, so any scroll offset is a single blit"""
+        if self.cave_strip_source is not cave_bg:
+            width, height = cave_bg.get_size()
+            self.cave_strip = pygame.Surface((width * 2, height), cave_bg.get_flags(), cave_bg)
+            # MAX onto the zeroed strip copies pixels exactly, alpha included
+            self.cave_strip.blit(cave_bg, (0, 0), special_flags=pygame.BLEND_RGBA_MAX)
+            self.cave_strip.blit(cave_bg, (width, 0), special_flags=pygame.BLEND_RGBA_MAX)
+            self.cave_strip_source = cave_bg
+        return self.cave_strip
+    
     def create_buttons(self):
         """Create main menu buttons"""
         button_width, button_height = 250, 60
@@ -214,6 +361,7 @@ class MainMenu:
             MenuButton("EXIT", 640 - button_width//2, start_y + spacing * 2, 
                       button_width, button_height, self.exit_game)
         ]
+        self.button_rects = [button.rect for button in self.buttons]
     
     def update(self, dt: float):
         """Update main menu animations"""
@@ -222,16 +370,15 @@ class MainMenu:
     def handle_event(self, event) -> Optional[str]:
         """Handle menu events"""
         if event.type == pygame.MOUSEMOTION:
-            mouse_pos = event.pos
-            for button in self.buttons:
-                button.hover = button.get_rect().collidepoint(mouse_pos)
+            hit = button_index_at(self.button_rects, event.pos)
+            for i, button in enumerate(self.buttons):
+                button.hover = i == hit
         
         elif event.type == pygame.MOUSEBUTTONDOWN:
             if event.button == 1:  # Left click
-                mouse_pos = event.pos
-                for button in self.buttons:
-                    if button.is_clicked(mouse_pos):
-                        return button.action()
+                hit = button_index_at(self.button_rects, event.pos)
+                if hit != -1 and self.buttons[hit].enabled:
+                    return self.buttons[hit].action()
         
         elif event.type == pygame.KEYDOWN:
             if event.key == pygame.K_RETURN:
@@ -245,73 +392,67 @@ class MainMenu:
     def draw(self):
         """Draw main menu"""
         # Background
-        bg = self.asset_manager.get_ui_element('main_menu_bg')
+        bg = self.assets.ui_element('main_menu_bg')
         if bg:
             self.screen.blit(bg, (0, 0))
         
         # Cave background if available
-        cave_bg = self.asset_manager.get_environment('cave_bg_1')
+        cave_bg = self.assets.environment('cave_bg_1')
         if cave_bg:
-            # Parallax scrolling background
+            # Parallax scrolling background, one window into a doubled strip
             scroll_x = int(self.animation_time * 10) % cave_bg.get_width()
-            self.screen.blit(cave_bg, (-scroll_x, 0))
-            if scroll_x > 0:
-                self.screen.blit(cave_bg, (-scroll_x + cave_bg.get_width(), 0))
+            self.screen.blit(self.get_cave_strip(cave_bg), (0, 0), (scroll_x, 0, 1280, 720))
             
             # Dark overlay for readability
-            overlay = pygame.Surface((1280, 720), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 180))
-            self.screen.blit(overlay, (0, 0))
+            self.screen.blit(self.dim_overlay, (0, 0))
         
         # Animated GIF logo if available (passed from menu system)
         if hasattr(self, 'gif_manager') and self.gif_manager:
             animated_logo = self.gif_manager.get_current_frame('logo', (400, 300))
             if animated_logo:
-                bounce = math.sin(self.animation_time * 0.002) * 10
+                bounce = fast_sin(self.animation_time * 0.002) * 10
                 logo_rect = animated_logo.get_rect(center=(640, 150 + bounce))
                 self.screen.blit(animated_logo, logo_rect)
             else:
                 # Fallback to static logo
-                logo = self.asset_manager.get_ui_element('reserka_logo')
+                logo = self.assets.ui_element('reserka_logo', alpha=True)
                 if logo:
-                    bounce = math.sin(self.animation_time * 0.002) * 10
+                    bounce = fast_sin(self.animation_time * 0.002) * 10
                     logo_rect = logo.get_rect(center=(640, 150 + bounce))
                     self.screen.blit(logo, logo_rect)
         else:
             # Fallback to static logo
-            logo = self.asset_manager.get_ui_element('reserka_logo')
+            logo = self.assets.ui_element('reserka_logo', alpha=True)
             if logo:
-                bounce = math.sin(self.animation_time * 0.002) * 10
+                bounce = fast_sin(self.animation_time * 0.002) * 10
                 logo_rect = logo.get_rect(center=(640, 150 + bounce))
                 self.screen.blit(logo, logo_rect)
         
         # Subtitle
-        font_subtitle = pygame.font.Font(None, 36)
-        subtitle = font_subtitle.render("Gothic Adventure Awaits", True, (200, 180, 120))
+        subtitle = render_cached(36, "Gothic Adventure Awaits", (200, 180, 120))
         subtitle_rect = subtitle.get_rect(center=(640, 250))
         self.screen.blit(subtitle, subtitle_rect)
         
-        # Draw buttons
-        font_button = pygame.font.Font(None, 48)
+        # Draw buttons; the labels go on top in one batch afterwards
+        text_blits = []
         for button in self.buttons:
             # Button background
             if button.hover:
-                color = (80, 60, 100)
-                glow = pygame.Surface((button.width + 20, button.height + 20), pygame.SRCALPHA)
-                glow.fill((120, 100, 150, 100))
-                glow_rect = glow.get_rect(center=button.get_rect().center)
+                color = self.COLOR_HOVER
+                glow = get_glow_surface(button.width + 20, button.height + 20)
+                glow_rect = glow.get_rect(center=button.center)
                 self.screen.blit(glow, glow_rect)
             else:
-                color = (60, 40, 80)
+                color = self.COLOR_IDLE
             
-            pygame.draw.rect(self.screen, color, button.get_rect())
-            pygame.draw.rect(self.screen, (100, 80, 120), button.get_rect(), 3)
+            pygame.draw.rect(self.screen, color, button.rect)
+            pygame.draw.rect(self.screen, self.COLOR_BORDER, button.rect, 3)
             
             # Button text
-            text_color = (255, 255, 255) if button.hover else (200, 200, 200)
-            text_surface = font_button.render(button.text, True, text_color)
-            text_rect = text_surface.get_rect(center=button.get_rect().center)
-            self.screen.blit(text_surface, text_rect)
+            text_color = self.TEXT_HOVER if button.hover else self.TEXT_IDLE
+            text_surface = render_cached(48, button.text, text_color)
+            text_blits.append((text_surface, text_surface.get_rect(center=button.center)))
+        blit_batch(self.screen, text_blits)
     
     def start_game(self) -> str:
         return "character_select"
@@ -325,12 +466,25 @@ class MainMenu:
 class SettingsMenu:
     """Settings menu with volume, resolution, and other options"""
     
-    def __init__(self, screen: pygame.Surface, asset_manager):
+    # Button colors
+    COLOR_HOVER = (80, 60, 100)
+    COLOR_IDLE = (60, 40, 80)
+    COLOR_BORDER = (100, 80, 120)
+    TEXT_HOVER = (255, 255, 255)
+    TEXT_IDLE = (200, 200, 200)
+    
+    def __init__(self, screen: pygame.Surface, asset_manager, channels: Optional[List] = None):
         self.screen = screen
         self.asset_manager = asset_manager
+        self.assets = ConvertedAssets(asset_manager)
+        self.channels = channels  # Mixer channels for master volume, looked up on first use if not given
         self.buttons = []
         self.sliders = []
         self.settings = self.load_settings()
+        self.settings_dirty = False
+        self.last_settings_change = 0.0
+        self.static_bg = None  # Screen snapshot without controls, for dirty-rect redraws
+        self.last_frame_state = None
         self.create_ui_elements()
     
     def load_settings(self) -> Dict[str, Any]:
@@ -358,12 +512,25 @@ class SettingsMenu:
     
     def save_settings(self):
         """Save settings to file"""
+        self.settings_dirty = False
         try:
-            with open("settings.json", 'w') as f:
+            # Write a temp file and swap it in so a failed write never truncates settings.json
+            with open("settings.json.tmp", 'w') as f:
                 json.dump(self.settings, f, indent=2)
+            os.replace("settings.json.tmp", "settings.json")
         except:
             pass
     
+    def mark_settings_dirty(self):
+        """Schedule a save once the settings stop changing"""
+        self.settings_dirty = True
+        self.last_settings_change = time.monotonic()
+    
+    def flush_settings(self):
+        """Write pending settings changes now"""
+        if self.settings_dirty:
+            self.save_settings()
+    
     def create_ui_elements(self):
         """Create settings UI elements"""
         # Volume sliders
@@ -384,38 +551,44 @@ class SettingsMenu:
             MenuButton("Reset to Defaults", 650, 470, 200, 50, self.reset_defaults),
             MenuButton("BACK", 550, 580, 180, 50, self.go_back)
         ]
+        self.button_rects = [button.rect for button in self.buttons]
     
     def update(self, dt: float):
         """Update settings menu"""
-        pass
+        if self.settings_dirty and time.monotonic() - self.last_settings_change > SETTINGS_SAVE_DELAY:
+            self.save_settings()
     
     def handle_event(self, event) -> Optional[str]:
         """Handle settings menu events"""
         if event.type == pygame.MOUSEMOTION:
-            mouse_pos = event.pos
-            for button in self.buttons:
-                button.hover = button.get_rect().collidepoint(mouse_pos)
+            hit = button_index_at(self.button_rects, event.pos)
+            for i, button in enumerate(self.buttons):
+                button.hover = i == hit
         
         elif event.type == pygame.MOUSEBUTTONDOWN:
             if event.button == 1:  # Left click
                 mouse_pos = event.pos
                 
                 # Check button clicks
-                for button in self.buttons:
-                    if button.is_clicked(mouse_pos):
-                        result = button.action()
-                        if result:
-                            return result
+                hit = button_index_at(self.button_rects, mouse_pos)
+                if hit != -1 and self.buttons[hit].enabled:
+                    result = self.buttons[hit].action()
+                    if result:
+                        return result
                 
                 # Check slider interactions
                 for slider in self.sliders:
-                    if slider.get_rect().collidepoint(mouse_pos):
+                    if slider.rect.collidepoint(mouse_pos):
                         rel_x = mouse_pos[0] - slider.x
                         ratio = max(0, min(1, rel_x / slider.width))
                         new_value = slider.min_value + ratio * (slider.max_value - slider.min_value)
                         slider.value = new_value
                         slider.callback(new_value)
         
+        elif event.type == pygame.MOUSEBUTTONUP:
+            if event.button == 1:
+                self.flush_settings()
+        
         elif event.type == pygame.KEYDOWN:
             if event.key == pygame.K_ESCAPE:
                 return self.go_back()
@@ -424,56 +597,35 @@ class SettingsMenu:
     
     def draw(self):
         """Draw settings menu"""
+        self.static_bg = None  # The caller redraws the whole screen, so any snapshot is stale
+        self.draw_static()
+        self.draw_controls()
+    
+    def draw_static(self):
+        """Draw the parts of the menu that only change when a setting is toggled"""
         # Background
-        bg = self.asset_manager.get_ui_element('settings_menu_bg')
+        bg = self.assets.ui_element('settings_menu_bg')
         if bg:
             self.screen.blit(bg, (0, 0))
         
         # Title
-        font_title = pygame.font.Font(None, 72)
-        title = font_title.render("SETTINGS", True, (255, 255, 255))
+        title = render_cached(72, "SETTINGS", (255, 255, 255))
         title_rect = title.get_rect(center=(640, 100))
         self.screen.blit(title, title_rect)
         
-        # Draw sliders
-        font_label = pygame.font.Font(None, 36)
+        # Slider labels and tracks; all text is collected and blitted in one batch at the end
+        text_blits = []
         for slider in self.sliders:
             # Label
-            label = font_label.render(slider.label, True, (200, 200, 200))
-            self.screen.blit(label, (slider.x, slider.y - 35))
+            label = render_cached(36, slider.label, (200, 200, 200))
+            text_blits.append((label, (slider.x, slider.y - 35)))
             
             # Slider track
-            track_rect = pygame.Rect(slider.x, slider.y + 10, slider.width, 10)
+            track_rect = slider.track_rect
             pygame.draw.rect(self.screen, (60, 60, 60), track_rect)
             pygame.draw.rect(self.screen, (120, 120, 120), track_rect, 2)
-            
-            # Slider handle
-            handle_x = slider.get_handle_pos()
-            handle_rect = pygame.Rect(handle_x - 8, slider.y + 5, 16, 20)
-            pygame.draw.rect(self.screen, (150, 150, 150), handle_rect)
-            pygame.draw.rect(self.screen, (200, 200, 200), handle_rect, 2)
-            
-            # Value display
-            value_text = f"{slider.value:.1f}"
-            value_surface = font_label.render(value_text, True, (255, 255, 255))
-            self.screen.blit(value_surface, (slider.x + slider.width + 20, slider.y))
-        
-        # Draw buttons
-        font_button = pygame.font.Font(None, 36)
-        for button in self.buttons:
-            # Button background
-            color = (80, 60, 100) if button.hover else (60, 40, 80)
-            pygame.draw.rect(self.screen, color, button.get_rect())
-            pygame.draw.rect(self.screen, (100, 80, 120), button.get_rect(), 2)
-            
-            # Button text
-            text_color = (255, 255, 255) if button.hover else (200, 200, 200)
-            text_surface = font_button.render(button.text, True, text_color)
-            text_rect = text_surface.get_rect(center=button.get_rect().center)
-            self.screen.blit(text_surface, text_rect)
         
         # Current settings display
-        font_small = pygame.font.Font(None, 24)
         settings_text = [
             f"Fullscreen: {'ON' if self.settings['fullscreen'] else 'OFF'}",
             f"VSync: {'ON' if self.settings['vsync'] else 'OFF'}",
@@ -481,27 +633,122 @@ class SettingsMenu:
         ]
         
         for i, text in enumerate(settings_text):
-            surface = font_small.render(text, True, (150, 150, 150))
-            self.screen.blit(surface, (50, 200 + i * 25))
+            surface = render_cached(24, text, (150, 150, 150))
+            text_blits.append((surface, (50, 200 + i * 25)))
+        
+        blit_batch(self.screen, text_blits)
+    
+    def draw_controls(self):
+        """Draw the slider handles and buttons, which change with input"""
+        text_blits = []
+        for slider in self.sliders:
+            self.draw_slider_handle(slider, text_blits)
+        for button in self.buttons:
+            self.draw_button(button, text_blits)
+        blit_batch(self.screen, text_blits)
+    
+    def draw_slider_handle(self, slider: MenuSlider, text_blits: List[tuple]):
+        """Draw a slider's handle, queueing its value label onto text_blits"""
+        # Slider handle
+        handle_x = slider.get_handle_pos()
+        handle_rect = slider.handle_rect
+        handle_rect.x = handle_x - 8
+        pygame.draw.rect(self.screen, (150, 150, 150), handle_rect)
+        pygame.draw.rect(self.screen, (200, 200, 200), handle_rect, 2)
+        
+        # Value display
+        value_text = f"{slider.value:.1f}"
+        value_surface = render_cached(36, value_text, (255, 255, 255))
+        text_blits.append((value_surface, (slider.x + slider.width + 20, slider.y)))
+    
+    def draw_button(self, button: MenuButton, text_blits: List[tuple]):
+        """Draw a button, queueing its label onto text_blits"""
+        # Button background
+        color = self.COLOR_HOVER if button.hover else self.COLOR_IDLE
+        pygame.draw.rect(self.screen, color, button.rect)
+        pygame.draw.rect(self.screen, self.COLOR_BORDER, button.rect, 2)
+        
+        # Button text
+        text_color = self.TEXT_HOVER if button.hover else self.TEXT_IDLE
+        text_surface = render_cached(36, button.text, text_color)
+        text_blits.append((text_surface, text_surface.get_rect(center=button.center)))
+    
+    def get_slider_area(self, slider: MenuSlider) -> pygame.Rect:
+        """Screen area covered by a slider's handle at any value, plus its value label"""
+        return pygame.Rect(slider.x - 8, slider.y, slider.width + 16 + SLIDER_VALUE_WIDTH, 30)
+    
+    def get_button_area(self, button: MenuButton) -> pygame.Rect:
+        """Screen area covered by a button and its label, which may be wider than the button"""
+        label = render_cached(36, button.text, self.TEXT_IDLE)
+        return button.rect.union(label.get_rect(center=button.center))
+    
+    def get_frame_state(self) -> tuple:
+        """Everything draw_controls and draw_static depend on, for change detection"""
+        return (tuple(button.hover for button in self.buttons),
+                tuple(slider.value for slider in self.sliders),
+                (self.settings['fullscreen'], self.settings['vsync'], self.settings['show_fps']))
+    
+    def draw_dirty(self) -> Optional[List[pygame.Rect]]:
+        """Redraw only the controls that changed since the last call.
+        
+        Only valid while the previous frame is still on screen. Returns the rects
+        to pass to pygame.display.update, or None after a full redraw.
+        """
+        state = self.get_frame_state()
+        last = self.last_frame_state
+        self.last_frame_state = state
+        if self.static_bg is None or last is None or state[2] != last[2] or len(state[0]) != len(last[0]):
+            # Snapshot the static layer, with whatever was behind it, to restore dirty areas from
+            self.draw_static()
+            self.static_bg = self.screen.copy()
+            self.draw_controls()
+            return None
+        
+        dirty = [button for button, hover, was in zip(self.buttons, state[0], last[0]) if hover != was]
+        moved = [slider for slider, value, was in zip(self.sliders, state[1], last[1]) if value != was]
+        if len(dirty) + len(moved) > DIRTY_RECT_LIMIT:
+            self.screen.blit(self.static_bg, (0, 0))
+            self.draw_controls()
+            return None
+        
+        rects = []
+        text_blits = []
+        for slider in moved:
+            area = self.get_slider_area(slider)
+            self.screen.blit(self.static_bg, area, area)
+            self.draw_slider_handle(slider, text_blits)
+            rects.append(area)
+        for button in dirty:
+            area = self.get_button_area(button)
+            self.screen.blit(self.static_bg, area, area)
+            self.draw_button(button, text_blits)
+            rects.append(area)
+        blit_batch(self.screen, text_blits)
+        return rects
     
     # Callback functions
     def set_master_volume(self, value: float):
         self.settings['master_volume'] = value
         # Set volume for all sound channels
-        for i in range(pygame.mixer.get_num_channels()):
-            channel = pygame.mixer.Channel(i)
+        for channel in self.get_channels():
             channel.set_volume(value)
-        self.save_settings()
+        self.mark_settings_dirty()
+    
+    def get_channels(self) -> List:
+        """Get the mixer channel objects, creating them once"""
+        if self.channels is None:
+            self.channels = [pygame.mixer.Channel(i) for i in range(pygame.mixer.get_num_channels())]
+        return self.channels
     
     def set_music_volume(self, value: float):
         self.settings['music_volume'] = value
         # Apply to background music when implemented
-        self.save_settings()
+        self.mark_settings_dirty()
     
     def set_sfx_volume(self, value: float):
         self.settings['sfx_volume'] = value
         # Apply to sound effects
-        self.save_settings()
+        self.mark_settings_dirty()
     
     def toggle_fullscreen(self):
         self.settings['fullscreen'] = not self.settings['fullscreen']
@@ -529,17 +776,42 @@ class SettingsMenu:
         self.save_settings()
     
     def go_back(self) -> str:
+        self.flush_settings()
         return "main_menu"
 
 class PauseMenu:
     """In-game pause menu"""
     
+    # Button colors
+    COLOR_HOVER = (90, 70, 120)
+    COLOR_IDLE = (60, 40, 80)
+    COLOR_BORDER = (140, 120, 160)
+    TEXT_HOVER = (255, 255, 255)
+    TEXT_IDLE = (200, 200, 200)
+    
     def __init__(self, screen: pygame.Surface, asset_manager):
         self.screen = screen
         self.asset_manager = asset_manager
         self.buttons = []
+        self.dim_overlay = create_dim_overlay()
+        self.title_surface = None
+        self.static_bg = None  # Screen snapshot without buttons, for dirty-rect redraws
+        self.last_hovers = None
         self.create_buttons()
     
+    def get_title_surface(self) -> pygame.Surface:
+        """Get the "GAME PAUSED" title composited over its offset glow, rendering it once"""
+        if self.title_surface is None:
+            title_text = "GAME PAUSED"
+            glow = render_cached(72, title_text, (100, 100, 200))
+            title = render_cached(72, title_text, (255, 255, 255))
+            # The glow sits 2px down and right of the main title
+            width, height = title.get_size()
+            self.title_surface = pygame.Surface((width + 2, height + 2), pygame.SRCALPHA)
+            self.title_surface.blit(glow, (2, 2))
+            self.title_surface.blit(title, (0, 0))
+        return self.title_surface
+    
     def create_buttons(self):
         """Create pause menu buttons"""
         button_width, button_height = 200, 50
@@ -556,6 +828,7 @@ class PauseMenu:
             MenuButton("EXIT GAME", 640 - button_width//2, start_y + spacing * 3, 
                       button_width, button_height, self.exit_game)
         ]
+        self.button_rects = [button.rect for button in self.buttons]
     
     def update(self, dt: float):
         """Update pause menu state"""
@@ -564,16 +837,15 @@ class PauseMenu:
     def handle_event(self, event) -> Optional[str]:
         """Handle pause menu events"""
         if event.type == pygame.MOUSEMOTION:
-            mouse_pos = event.pos
-            for button in self.buttons:
-                button.hover = button.get_rect().collidepoint(mouse_pos)
+            hit = button_index_at(self.button_rects, event.pos)
+            for i, button in enumerate(self.buttons):
+                button.hover = i == hit
         
         elif event.type == pygame.MOUSEBUTTONDOWN:
             if event.button == 1:
-                mouse_pos = event.pos
-                for button in self.buttons:
-                    if button.is_clicked(mouse_pos):
-                        return button.action()
+                hit = button_index_at(self.button_rects, event.pos)
+                if hit != -1 and self.buttons[hit].enabled:
+                    return self.buttons[hit].action()
         
         elif event.type == pygame.KEYDOWN:
             if event.key == pygame.K_ESCAPE:
@@ -583,63 +855,94 @@ class PauseMenu:
     
     def draw(self):
         """Draw pause menu overlay"""
+        self.static_bg = None  # The caller redraws the whole screen, so any snapshot is stale
+        self.draw_static()
+        self.draw_buttons()
+    
+    def draw_static(self):
+        """Draw the overlay, title and captions, which never change while paused"""
         # Semi-transparent overlay with gradient
-        overlay = pygame.Surface((1280, 720), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self.dim_overlay, (0, 0))
         
         # Pause title with glow effect
-        font_title = pygame.font.Font(None, 72)
-        title_text = "GAME PAUSED"
-        
-        # Title glow
-        title_glow = font_title.render(title_text, True, (100, 100, 200))
-        title_glow_rect = title_glow.get_rect(center=(642, 152))
-        self.screen.blit(title_glow, title_glow_rect)
-        
-        # Main title
-        title = font_title.render(title_text, True, (255, 255, 255))
-        title_rect = title.get_rect(center=(640, 150))
+        title = self.get_title_surface()
+        title_rect = title.get_rect(center=(641, 151))
         self.screen.blit(title, title_rect)
         
         # Instructions
-        font_small = pygame.font.Font(None, 28)
         instruction_text = "Press ESC to resume game"
-        instruction_surface = font_small.render(instruction_text, True, (200, 200, 200))
+        instruction_surface = render_cached(28, instruction_text, (200, 200, 200))
         instruction_rect = instruction_surface.get_rect(center=(640, 190))
         self.screen.blit(instruction_surface, instruction_rect)
         
-        # Draw buttons with enhanced styling
-        font_button = pygame.font.Font(None, 42)
-        for button in self.buttons:
-            # Button glow for hover effect
-            if button.hover:
-                color = (90, 70, 120)
-                # Add glow effect
-                glow_surface = pygame.Surface((button.width + 10, button.height + 10), pygame.SRCALPHA)
-                glow_surface.fill((120, 100, 150, 100))
-                glow_rect = glow_surface.get_rect(center=button.get_rect().center)
-                self.screen.blit(glow_surface, glow_rect)
-            else:
-                color = (60, 40, 80)
-            
-            # Main button
-            pygame.draw.rect(self.screen, color, button.get_rect())
-            pygame.draw.rect(self.screen, (140, 120, 160), button.get_rect(), 3)
-            
-            # Button text with enhanced styling
-            text_color = (255, 255, 255) if button.hover else (200, 200, 200)
-            text_surface = font_button.render(button.text, True, text_color)
-            text_rect = text_surface.get_rect(center=button.get_rect().center)
-            self.screen.blit(text_surface, text_rect)
-        
         # Additional game info at bottom
-        font_info = pygame.font.Font(None, 24)
         info_text = "Your progress is automatically saved"
-        info_surface = font_info.render(info_text, True, (150, 150, 150))
+        info_surface = render_cached(24, info_text, (150, 150, 150))
         info_rect = info_surface.get_rect(center=(640, 600))
         self.screen.blit(info_surface, info_rect)
     
+    def draw_buttons(self):
+        """Draw every button; labels go on top in one batch afterwards"""
+        text_blits = []
+        for button in self.buttons:
+            self.draw_button(button, text_blits)
+        blit_batch(self.screen, text_blits)
+    
+    def draw_button(self, button: MenuButton, text_blits: List[tuple]):
+        """Draw a button with enhanced styling, queueing its label onto text_blits"""
+        # Button glow for hover effect
+        if button.hover:
+            color = self.COLOR_HOVER
+            # Add glow effect
+            glow_surface = get_glow_surface(button.width + 10, button.height + 10)
+            glow_rect = glow_surface.get_rect(center=button.center)
+            self.screen.blit(glow_surface, glow_rect)
+        else:
+            color = self.COLOR_IDLE
+        
+        # Main button
+        pygame.draw.rect(self.screen, color, button.rect)
+        pygame.draw.rect(self.screen, self.COLOR_BORDER, button.rect, 3)
+        
+        # Button text with enhanced styling
+        text_color = self.TEXT_HOVER if button.hover else self.TEXT_IDLE
+        text_surface = render_cached(42, button.text, text_color)
+        text_blits.append((text_surface, text_surface.get_rect(center=button.center)))
+    
+    def draw_dirty(self) -> Optional[List[pygame.Rect]]:
+        """Redraw only the buttons whose hover state changed since the last call.
+        
+        Only valid while the previous frame, including the paused game behind the
+        overlay, is still on screen. Returns the rects to pass to
+        pygame.display.update, or None after a full redraw.
+        """
+        hovers = tuple(button.hover for button in self.buttons)
+        last = self.last_hovers
+        self.last_hovers = hovers
+        if self.static_bg is None or last is None:
+            # Snapshot the paused game under the overlay to restore dirty areas from
+            self.draw_static()
+            self.static_bg = self.screen.copy()
+            self.draw_buttons()
+            return None
+        
+        dirty = [button for button, hover, was in zip(self.buttons, hovers, last) if hover != was]
+        if len(dirty) > DIRTY_RECT_LIMIT:
+            self.screen.blit(self.static_bg, (0, 0))
+            self.draw_buttons()
+            return None
+        
+        rects = []
+        text_blits = []
+        for button in dirty:
+            # Covers the hover glow as well as the button itself
+            area = button.rect.inflate(10, 10)
+            self.screen.blit(self.static_bg, area, area)
+            self.draw_button(button, text_blits)
+            rects.append(area)
+        blit_batch(self.screen, text_blits)
+        return rects
+    
     def resume_game(self) -> str:
         return "resume"
     
@@ -677,94 +980,124 @@ class MenuSystem:
         self.loading_screen = LoadingScreen(screen, asset_manager)
         self.main_menu = MainMenu(screen, asset_manager)
         self.main_menu.gif_manager = self.gif_manager  # Pass GIF manager to main menu
-        self.settings_menu = SettingsMenu(screen, asset_manager)
+        # Channel objects are created once and reused for every volume change
+        channels = None
+        if pygame.mixer.get_init():
+            channels = [pygame.mixer.Channel(i) for i in range(pygame.mixer.get_num_channels())]
+        self.settings_menu = SettingsMenu(screen, asset_manager, channels)
         self.pause_menu = PauseMenu(screen, asset_manager)
         
         # Loading progress
         self.loading_progress = 0.0
         self.loading_complete = False
+        
+        # (update, handle_event, draw) for each state that shows a menu
+        self.state_handlers = {
+            MenuState.LOADING: (self.update_loading, self.handle_loading_event, self.loading_screen.draw),
+            MenuState.MAIN_MENU: (self.main_menu.update, self.handle_main_menu_event, self.main_menu.draw),
+            MenuState.SETTINGS: (self.settings_menu.update, self.handle_settings_event, self.settings_menu.draw),
+            MenuState.PAUSE_MENU: (self.pause_menu.update, self.handle_pause_event, self.pause_menu.draw),
+        }
+        # Menus that can redraw just their changed controls over the previous frame
+        self.dirty_rect_menus = {
+            MenuState.SETTINGS: self.settings_menu,
+            MenuState.PAUSE_MENU: self.pause_menu,
+        }
+        self.last_drawn_state = None
     
     def update(self, dt: float):
         """Update current menu state"""
-        # Update animated GIF
-        self.gif_manager.update_all()
-        
-        if self.current_state == MenuState.LOADING:
-            if not self.loading_complete:
-                # Simulate loading progress
-                self.loading_progress += dt * 0.001  # Adjust speed as needed
-                if self.loading_progress >= 1.0:
-                    self.loading_progress = 1.0
-                    self.loading_complete = True
-            
-            self.loading_screen.update(dt, self.loading_progress)
-            
-        elif self.current_state == MenuState.MAIN_MENU:
-            self.main_menu.update(dt)
-        
-        elif self.current_state == MenuState.SETTINGS:
-            self.settings_menu.update(dt)
+        # The animated logo is only shown on the main menu
+        if self.current_state == MenuState.MAIN_MENU:
+            self.gif_manager.update_all()
         
-        elif self.current_state == MenuState.PAUSE_MENU:
-            self.pause_menu.update(dt)
+        handlers = self.state_handlers.get(self.current_state)
+        if handlers:
+            handlers[0](dt)
     
     def handle_event(self, event) -> Optional[str]:
         """Handle menu events and return game actions"""
-        result = None
-        
-        if self.current_state == MenuState.LOADING:
-            if self.loading_complete:
-                if event.type == pygame.KEYDOWN or event.type == pygame.MOUSEBUTTONDOWN:
-                    self.current_state = MenuState.MAIN_MENU
-        
-        elif self.current_state == MenuState.MAIN_MENU:
-            action = self.main_menu.handle_event(event)
-            if action == "character_select":
-                return "start_game"  # Signal to start game
-            elif action == "settings":
-                self.previous_state = self.current_state
-                self.current_state = MenuState.SETTINGS
-            elif action == "exit_confirm":
-                return "exit_game"
-        
-        elif self.current_state == MenuState.SETTINGS:
-            action = self.settings_menu.handle_event(event)
-            if action == "main_menu":
-                # Return to the appropriate previous state
-                if self.previous_state == MenuState.PAUSE_MENU:
-                    self.current_state = MenuState.PAUSE_MENU
-                    return None  # Stay in pause menu
-                else:
-                    self.current_state = MenuState.MAIN_MENU
-                    return None
-        
-        elif self.current_state == MenuState.PAUSE_MENU:
-            action = self.pause_menu.handle_event(event)
-            if action == "resume":
-                return "resume_game"
-            elif action == "settings":
-                self.previous_state = self.current_state
-                self.current_state = MenuState.SETTINGS
-            elif action == "main_menu":
-                return "main_menu"
-            elif action == "exit_confirm":
-                return "exit_game"
-        
+        handlers = self.state_handlers.get(self.current_state)
+        if handlers:
+            return handlers[1](event)
         return None
     
     def draw(self):
         """Draw current menu state"""
-        if self.current_state == MenuState.LOADING:
-            self.loading_screen.draw()
-        
-        elif self.current_state == MenuState.MAIN_MENU:
-            self.main_menu.draw()
+        self.last_drawn_state = self.current_state
+        handlers = self.state_handlers.get(self.current_state)
+        if handlers:
+            handlers[2]()
+    
+    def draw_dirty(self) -> Optional[List[pygame.Rect]]:
+        """Draw current menu state over the previous frame, repainting only what changed.
         
-        elif self.current_state == MenuState.SETTINGS:
-            self.settings_menu.draw()
+        Returns the rects to pass to pygame.display.update, or None when the whole
+        screen was redrawn and should be flipped.
+        """
+        menu = self.dirty_rect_menus.get(self.current_state)
+        if menu is None:
+            self.draw()
+            return None
+        if self.last_drawn_state != self.current_state:
+            menu.static_bg = None  # Whatever was snapshotted belongs to an earlier visit
+        self.last_drawn_state = self.current_state
+        return menu.draw_dirty()
+    
+    def update_loading(self, dt: float):
+        """Advance loading progress and the loading screen animation"""
+        if not self.loading_complete:
+            # Simulate loading progress
+            self.loading_progress += dt * 0.001  # Adjust speed as needed
+            if self.loading_progress >= 1.0:
+                self.loading_progress = 1.0
+                self.loading_complete = True
         
-        elif self.current_state == MenuState.PAUSE_MENU:
-            self.pause_menu.draw()
+        self.loading_screen.update(dt, self.loading_progress)
+    
+    def handle_loading_event(self, event) -> Optional[str]:
+        """Leave the loading screen on any key or click once loading is done"""
+        if self.loading_complete:
+            if event.type == pygame.KEYDOWN or event.type == pygame.MOUSEBUTTONDOWN:
+                self.current_state = MenuState.MAIN_MENU
+        return None
+    
+    def handle_main_menu_event(self, event) -> Optional[str]:
+        """Handle main menu events"""
+        action = self.main_menu.handle_event(event)
+        if action == "character_select":
+            return "start_game"  # Signal to start game
+        elif action == "settings":
+            self.previous_state = self.current_state
+            self.current_state = MenuState.SETTINGS
+        elif action == "exit_confirm":
+            return "exit_game"
+        return None
+    
+    def handle_settings_event(self, event) -> Optional[str]:
+        """Handle settings menu events, returning to wherever settings was opened from"""
+        action = self.settings_menu.handle_event(event)
+        if action == "main_menu":
+            # Return to the appropriate previous state
+            if self.previous_state == MenuState.PAUSE_MENU:
+                self.current_state = MenuState.PAUSE_MENU  # Stay in pause menu
+            else:
+                self.current_state = MenuState.MAIN_MENU
+        return None
+    
+    def handle_pause_event(self, event) -> Optional[str]:
+        """Handle pause menu events"""
+        action = self.pause_menu.handle_event(event)
+        if action == "resume":
+            return "resume_game"
+        elif action == "settings":
+            self.previous_state = self.current_state
+            self.current_state = MenuState.SETTINGS
+        elif action == "main_menu":
+            return "main_menu"
+        elif action == "exit_confirm":
+            return "exit_game"
+        return None
     
     def show_pause_menu(self):
         """Show pause menu"""
@@ -812,9 +1145,12 @@ def main():
                 print("Starting game...")
         
         menu_system.update(dt)
-        menu_system.draw()
+        dirty_rects = menu_system.draw_dirty()
         
-        pygame.display.flip()
+        if dirty_rects is None:
+            pygame.display.flip()
+        elif dirty_rects:
+            pygame.display.update(dirty_rects)
     
     pygame.quit()
 
@@ -5,18 +5,112 @@ Implements smooth camera following, room-based constraints, and cinematic transi
 """
 
 import pygame
+import logging
 import math
-from typing import Optional, Tuple, Dict, Any
+import operator
+import random
+import sys
+from array import array
+from typing import Optional, Tuple, Dict, Any, List
 from dataclasses import dataclass
 from enum import Enum
 
+def effects_step(dt: float, shake_intensity: float, shake_timer: float,
+                 zoom: float, target_zoom: float) -> Tuple[float, float, float]:
+    """One frame of shake decay and zoom smoothing on plain floats.
+    
+    Returns the new (shake_intensity, shake_timer, zoom).
+    """
+    # Update camera shake
+    if shake_timer > 0:
+        shake_timer -= dt
+        if shake_timer <= 0:
+            shake_intensity = 0
+    
+    # Update zoom, settling exactly on the target once within a step of it
+    if abs(zoom - target_zoom) > 0.01:
+        zoom += (target_zoom - zoom) * 0.05
+    else:
+        zoom = target_zoom
+    return shake_intensity, shake_timer, zoom
+
+def ease_in_out_cubic(t: float) -> float:
+    """Cubic easing function for smooth transitions"""
+    if t < 0.5:
+        return 4 * t * t * t
+    else:
+        return 1 - pow(-2 * t + 2, 3) / 2
+
+# Eased values sampled across [0, 1], linearly interpolated during transitions
+EASE_LUT_SIZE = 1024
+_EASE_LUT = array('d', [ease_in_out_cubic(i / (EASE_LUT_SIZE - 1)) for i in range(EASE_LUT_SIZE)])
+_EASE_LUT_SCALE = float(EASE_LUT_SIZE - 1)
+
+# Camera events fire on every room change; they are debug logs, silent unless enabled
+logger = logging.getLogger(__name__)
+
+# Drop the per-instance __dict__ where the interpreter allows it
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Shake offsets in [-1, 1] are drawn in batches of this many (x, y) pairs
+SHAKE_BATCH_SIZE = 256
+
+def fill_shake_offsets(offsets: array):
+    """Refill an array of interleaved x, y shake offsets with fresh random values"""
+    uniform = random.uniform
+    for i in range(len(offsets)):
+        offsets[i] = uniform(-1.0, 1.0)
+
+def follow_step(x: float, y: float, target_x: float, target_y: float,
+                player_x: float, player_y: float, vel_x: float, vel_y: float,
+                half_width: int, half_height: int, look_ahead_distance: float,
+                deadzone_width: float, deadzone_height: float,
+                smooth_factor: float) -> Tuple[float, float, float, float]:
+    """One frame of deadzone player following on plain floats.
+    
+    Returns the new (x, y, target_x, target_y) of the camera's top-left corner.
+    """
+    # Calculate camera center position
+    camera_center_x = x + half_width
+    camera_center_y = y + half_height
+    
+    # Calculate target position with look-ahead
+    look_ahead_x = vel_x * look_ahead_distance * 0.01  # Scale down velocity influence
+    look_ahead_y = vel_y * look_ahead_distance * 0.005  # Less vertical look-ahead
+    
+    # Apply deadzone - only move camera if player is outside deadzone
+    dx = player_x + look_ahead_x - camera_center_x
+    dy = player_y + look_ahead_y - 50 - camera_center_y  # Offset camera slightly above player
+    
+    # Player inside the deadzone and camera already (within 0.1px of) at rest: settle on the target
+    if (-deadzone_width <= dx <= deadzone_width and -deadzone_height <= dy <= deadzone_height
+            and abs(x - target_x) < 0.1 and abs(y - target_y) < 0.1):
+        return target_x, target_y, target_x, target_y
+    
+    # Horizontal deadzone
+    if dx > deadzone_width:
+        target_x = camera_center_x + deadzone_width - half_width
+    elif dx < -deadzone_width:
+        target_x = camera_center_x - deadzone_width - half_width
+    
+    # Vertical deadzone
+    if dy > deadzone_height:
+        target_y = camera_center_y + deadzone_height - half_height
+    elif dy < -deadzone_height:
+        target_y = camera_center_y - deadzone_height - half_height
+    
+    # Apply smooth following
+    x += (target_x - x) * smooth_factor
+    y += (target_y - y) * smooth_factor
+    return x, y, target_x, target_y
+
 class CameraMode(Enum):
     FOLLOW_PLAYER = "follow_player"
     ROOM_LOCKED = "room_locked"
     CINEMATIC = "cinematic"
     TRANSITION = "transition"
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CameraConstraints:
     """Camera movement constraints for a room/area"""
     left: int = 0
@@ -25,7 +119,7 @@ class CameraConstraints:
     bottom: int = 720
     smooth_edges: bool = True
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CameraTarget:
     """Camera target with position and priority"""
     x: float
@@ -42,6 +136,8 @@ class MetroidvaniaCamera:
     def __init__(self, screen_width: int, screen_height: int):
         self.screen_width = screen_width
         self.screen_height = screen_height
+        self.half_width = screen_width // 2
+        self.half_height = screen_height // 2
         
         # Camera position (top-left of viewport)
         self.x = 0.0
@@ -58,17 +154,31 @@ class MetroidvaniaCamera:
         self.deadzone_width = 80   # Horizontal deadzone around player
         self.deadzone_height = 60  # Vertical deadzone around player
         
-        # Current constraints
+        # Extra points of interest, one column per CameraTarget field, blended by priority
+        self.target_xs = array('d')
+        self.target_ys = array('d')
+        self.target_priorities = array('d')
+        self.target_smooth_factors = array('d')
+        
+        # Current constraints, and the camera position bounds derived from them
         self.constraints = CameraConstraints()
+        self._update_bounds()
         
         # Shake effect
         self.shake_intensity = 0.0
         self.shake_duration = 0.0
         self.shake_timer = 0.0
+        self.shake_offsets = array('d', bytes(16 * SHAKE_BATCH_SIZE))
+        fill_shake_offsets(self.shake_offsets)
+        self.shake_index = 0
+        
+        # Render position for the current frame, sampled once per update
+        self.render_pos = (0, 0)
         
         # Zoom (for future use)
         self.zoom = 1.0
         self.target_zoom = 1.0
+        self.zoom_is_one = True  # Lets coordinate transforms skip the zoom multiply
         
         # Room transition
         self.transitioning = False
@@ -80,23 +190,37 @@ class MetroidvaniaCamera:
         # Player velocity tracking for look-ahead
         self.player_vel_x = 0.0
         self.player_vel_y = 0.0
-        self.velocity_history = []
         self.max_history = 5
-        
-        print("📷 Metroidvania Camera System initialized")
+        # Ring buffer of recent velocities with running sums, so averaging is O(1) per frame
+        self.vel_history_x = array('d', [0.0] * self.max_history)
+        self.vel_history_y = array('d', [0.0] * self.max_history)
+        self.vel_history_index = 0
+        self.vel_history_count = 0
+        self.vel_sum_x = 0.0
+        self.vel_sum_y = 0.0
+        
+        logger.debug("Metroidvania Camera System initialized")
     
     def update(self, dt: float, player_pos: Tuple[float, float], player_vel: Tuple[float, float] = (0, 0)):
         """Update camera position and effects"""
         
         # Update player velocity tracking
-        self.player_vel_x, self.player_vel_y = player_vel
-        self.velocity_history.append(player_vel)
-        if len(self.velocity_history) > self.max_history:
-            self.velocity_history.pop(0)
+        vel_x, vel_y = player_vel
+        self.player_vel_x, self.player_vel_y = vel_x, vel_y
+        
+        # Swap the oldest sample out of the running sums for the newest
+        i = self.vel_history_index
+        self.vel_sum_x += vel_x - self.vel_history_x[i]
+        self.vel_sum_y += vel_y - self.vel_history_y[i]
+        self.vel_history_x[i] = vel_x
+        self.vel_history_y[i] = vel_y
+        self.vel_history_index = (i + 1) % self.max_history
+        if self.vel_history_count < self.max_history:
+            self.vel_history_count += 1
         
         # Calculate average velocity for smoother look-ahead
-        avg_vel_x = sum(v[0] for v in self.velocity_history) / len(self.velocity_history) if self.velocity_history else 0
-        avg_vel_y = sum(v[1] for v in self.velocity_history) / len(self.velocity_history) if self.velocity_history else 0
+        avg_vel_x = self.vel_sum_x / self.vel_history_count
+        avg_vel_y = self.vel_sum_y / self.vel_history_count
         
         if self.mode == CameraMode.FOLLOW_PLAYER:
             self._update_follow_player(player_pos, (avg_vel_x, avg_vel_y))
@@ -108,59 +232,24 @@ class MetroidvaniaCamera:
         # Apply constraints
         self._apply_constraints()
         
-        # Update camera shake
-        if self.shake_timer > 0:
-            self.shake_timer -= dt
-            if self.shake_timer <= 0:
-                self.shake_intensity = 0
+        # Update camera shake and zoom, which are both idle most frames
+        if self.shake_timer > 0 or self.zoom != self.target_zoom:
+            self.shake_intensity, self.shake_timer, self.zoom = effects_step(
+                dt, self.shake_intensity, self.shake_timer, self.zoom, self.target_zoom)
+            self.zoom_is_one = self.zoom == 1.0
         
-        # Update zoom
-        if abs(self.zoom - self.target_zoom) > 0.01:
-            self.zoom += (self.target_zoom - self.zoom) * 0.05
+        # Everything drawn this frame shares one shake offset
+        self.render_pos = self.get_render_position()
     
     def _update_follow_player(self, player_pos: Tuple[float, float], player_vel: Tuple[float, float]):
         """Update camera when following player with advanced techniques"""
         player_x, player_y = player_pos
         vel_x, vel_y = player_vel
-        
-        # Calculate camera center position
-        camera_center_x = self.x + self.screen_width // 2
-        camera_center_y = self.y + self.screen_height // 2
-        
-        # Calculate target position with look-ahead
-        look_ahead_x = vel_x * self.look_ahead_distance * 0.01  # Scale down velocity influence
-        look_ahead_y = vel_y * self.look_ahead_distance * 0.005  # Less vertical look-ahead
-        
-        target_center_x = player_x + look_ahead_x
-        target_center_y = player_y + look_ahead_y - 50  # Offset camera slightly above player
-        
-        # Apply deadzone - only move camera if player is outside deadzone
-        dx = target_center_x - camera_center_x
-        dy = target_center_y - camera_center_y
-        
-        # Horizontal deadzone
-        if abs(dx) > self.deadzone_width:
-            if dx > 0:
-                target_center_x = camera_center_x + self.deadzone_width
-            else:
-                target_center_x = camera_center_x - self.deadzone_width
-            
-            # Smooth movement
-            self.target_x = target_center_x - self.screen_width // 2
-        
-        # Vertical deadzone  
-        if abs(dy) > self.deadzone_height:
-            if dy > 0:
-                target_center_y = camera_center_y + self.deadzone_height
-            else:
-                target_center_y = camera_center_y - self.deadzone_height
-                
-            # Smooth movement
-            self.target_y = target_center_y - self.screen_height // 2
-        
-        # Apply smooth following
-        self.x += (self.target_x - self.x) * self.smooth_factor
-        self.y += (self.target_y - self.y) * self.smooth_factor
+        self.x, self.y, self.target_x, self.target_y = follow_step(
+            self.x, self.y, self.target_x, self.target_y,
+            player_x, player_y, vel_x, vel_y,
+            self.half_width, self.half_height, self.look_ahead_distance,
+            self.deadzone_width, self.deadzone_height, self.smooth_factor)
     
     def _update_room_locked(self, player_pos: Tuple[float, float]):
         """Update camera when locked to room boundaries"""
@@ -191,37 +280,62 @@ class MetroidvaniaCamera:
             self.mode = CameraMode.FOLLOW_PLAYER
     
     def _ease_in_out_cubic(self, t: float) -> float:
-        """Cubic easing function for smooth transitions"""
-        if t < 0.5:
-            return 4 * t * t * t
-        else:
-            return 1 - pow(-2 * t + 2, 3) / 2
+        """Cubic easing for t in [0, 1], interpolated from the precomputed table"""
+        pos = t * _EASE_LUT_SCALE
+        i = int(pos)
+        if i >= EASE_LUT_SIZE - 1:
+            return _EASE_LUT[-1]
+        lo = _EASE_LUT[i]
+        return lo + (_EASE_LUT[i + 1] - lo) * (pos - i)
+    
+    def _update_bounds(self):
+        """Cache the allowed range of the camera's top-left corner under the constraints"""
+        c = self.constraints
+        self.min_x = c.left
+        self.min_y = c.top
+        # A room smaller than the screen pins the camera to its left/top edge
+        self.max_x = max(c.left, c.right - self.screen_width)
+        self.max_y = max(c.top, c.bottom - self.screen_height)
     
     def _apply_constraints(self):
         """Apply camera movement constraints"""
+        min_x, max_x, min_y, max_y = self.min_x, self.max_x, self.min_y, self.max_y
+        
         # Clamp camera position to constraints
-        self.x = max(self.constraints.left, min(self.x, self.constraints.right - self.screen_width))
-        self.y = max(self.constraints.top, min(self.y, self.constraints.bottom - self.screen_height))
+        x, y = self.x, self.y
+        self.x = min_x if x < min_x else (max_x if x > max_x else x)
+        self.y = min_y if y < min_y else (max_y if y > max_y else y)
         
         # Update targets to match constraints
-        self.target_x = max(self.constraints.left, min(self.target_x, self.constraints.right - self.screen_width))
-        self.target_y = max(self.constraints.top, min(self.target_y, self.constraints.bottom - self.screen_height))
+        x, y = self.target_x, self.target_y
+        self.target_x = min_x if x < min_x else (max_x if x > max_x else x)
+        self.target_y = min_y if y < min_y else (max_y if y > max_y else y)
     
     def get_render_position(self) -> Tuple[int, int]:
         """Get final camera position with shake applied"""
-        shake_x = shake_y = 0
-        
-        if self.shake_intensity > 0:
-            import random
-            shake_x = random.uniform(-self.shake_intensity, self.shake_intensity)
-            shake_y = random.uniform(-self.shake_intensity, self.shake_intensity)
+        if self.shake_intensity <= 0:
+            # Position is kept in sub-pixel floats; pixels are only needed here
+            return (int(self.x), int(self.y))
+        
+        i = self.shake_index
+        shake_x = self.shake_offsets[i] * self.shake_intensity
+        shake_y = self.shake_offsets[i + 1] * self.shake_intensity
+        i += 2
+        if i == len(self.shake_offsets):
+            fill_shake_offsets(self.shake_offsets)
+            i = 0
+        self.shake_index = i
         
         return (int(self.x + shake_x), int(self.y + shake_y))
     
     def set_constraints(self, constraints: CameraConstraints):
         """Set new camera constraints for current room/area"""
+        if constraints == self.constraints:
+            return  # The game re-applies its level's constraints every frame
         self.constraints = constraints
-        print(f"📷 Camera constraints updated: {constraints.left}-{constraints.right}, {constraints.top}-{constraints.bottom}")
+        self._update_bounds()
+        logger.debug("Camera constraints updated: %s-%s, %s-%s",
+                     constraints.left, constraints.right, constraints.top, constraints.bottom)
     
     def start_room_transition(self, end_pos: Tuple[float, float], duration: float = 1000):
         """Start a smooth transition to a new room"""
@@ -232,12 +346,12 @@ class MetroidvaniaCamera:
         self.transition_start_pos = (self.x, self.y)
         self.transition_end_pos = end_pos
         
-        print(f"📷 Starting room transition to {end_pos}")
+        logger.debug("Starting room transition to %s", end_pos)
     
     def set_mode(self, mode: CameraMode):
         """Change camera mode"""
         self.mode = mode
-        print(f"📷 Camera mode changed to {mode.value}")
+        logger.debug("Camera mode changed to %s", mode.value)
     
     def add_shake(self, intensity: float, duration: float):
         """Add camera shake effect"""
@@ -251,17 +365,39 @@ class MetroidvaniaCamera:
         else:
             self.zoom = zoom
             self.target_zoom = zoom
+            self.zoom_is_one = zoom == 1.0
+    
+    def add_target(self, target: CameraTarget):
+        """Add a point of interest to blend by priority"""
+        self.target_xs.append(target.x)
+        self.target_ys.append(target.y)
+        self.target_priorities.append(target.priority)
+        self.target_smooth_factors.append(target.smooth_factor)
+    
+    def clear_targets(self):
+        """Remove all points of interest"""
+        del self.target_xs[:], self.target_ys[:], self.target_priorities[:], self.target_smooth_factors[:]
+    
+    def get_blended_target(self) -> Optional[Tuple[float, float]]:
+        """Priority-weighted average of the points of interest, or None if there are none"""
+        total = sum(self.target_priorities)
+        if total <= 0:
+            return None
+        weights = self.target_priorities
+        return (sum(map(operator.mul, self.target_xs, weights)) / total,
+                sum(map(operator.mul, self.target_ys, weights)) / total)
     
     def focus_on_point(self, pos: Tuple[float, float], immediate: bool = False):
         """Focus camera on a specific point"""
-        target_x = pos[0] - self.screen_width // 2
-        target_y = pos[1] - self.screen_height // 2
+        target_x = pos[0] - self.half_width
+        target_y = pos[1] - self.half_height
         
         if immediate:
             self.x = target_x
             self.y = target_y
             self.target_x = target_x
             self.target_y = target_y
+            self.render_pos = self.get_render_position()
         else:
             self.target_x = target_x
             self.target_y = target_y
@@ -269,7 +405,10 @@ class MetroidvaniaCamera:
     def world_to_screen(self, world_pos: Tuple[float, float]) -> Tuple[int, int]:
         """Convert world coordinates to screen coordinates"""
         world_x, world_y = world_pos
-        camera_x, camera_y = self.get_render_position()
+        camera_x, camera_y = self.render_pos
+        
+        if self.zoom_is_one:
+            return (int(world_x - camera_x), int(world_y - camera_y))
         
         screen_x = int((world_x - camera_x) * self.zoom)
         screen_y = int((world_y - camera_y) * self.zoom)
@@ -279,7 +418,10 @@ class MetroidvaniaCamera:
     def screen_to_world(self, screen_pos: Tuple[int, int]) -> Tuple[float, float]:
         """Convert screen coordinates to world coordinates"""
         screen_x, screen_y = screen_pos
-        camera_x, camera_y = self.get_render_position()
+        camera_x, camera_y = self.render_pos
+        
+        if self.zoom_is_one:
+            return (screen_x + camera_x, screen_y + camera_y)
         
         world_x = (screen_x / self.zoom) + camera_x
         world_y = (screen_y / self.zoom) + camera_y
@@ -294,9 +436,29 @@ class MetroidvaniaCamera:
         return (-margin < screen_pos[0] < self.screen_width + margin and 
                 -margin < screen_pos[1] < self.screen_height + margin)
     
+    def world_to_screen_batch(self, positions: List[Tuple[float, float]]) -> List[Tuple[int, int]]:
+        """Convert many world positions to screen coordinates in one pass"""
+        camera_x, camera_y = self.render_pos
+        if self.zoom_is_one:
+            return [(int(x - camera_x), int(y - camera_y)) for x, y in positions]
+        zoom = self.zoom
+        return [(int((x - camera_x) * zoom), int((y - camera_y) * zoom)) for x, y in positions]
+    
+    def visible_mask(self, positions: List[Tuple[float, float]], margin: int = 100) -> List[bool]:
+        """Check many world positions for visibility at once, matching is_on_screen for each"""
+        camera_x, camera_y = self.render_pos
+        right = self.screen_width + margin
+        bottom = self.screen_height + margin
+        if self.zoom_is_one:
+            return [-margin < int(x - camera_x) < right and -margin < int(y - camera_y) < bottom
+                    for x, y in positions]
+        zoom = self.zoom
+        return [-margin < int((x - camera_x) * zoom) < right and -margin < int((y - camera_y) * zoom) < bottom
+                for x, y in positions]
+    
     def get_visible_bounds(self) -> Tuple[float, float, float, float]:
         """Get the world bounds of what's currently visible"""
-        camera_x, camera_y = self.get_render_position()
+        camera_x, camera_y = self.render_pos
         
         left = camera_x
         right = camera_x + self.screen_width
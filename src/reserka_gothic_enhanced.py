@@ -696,7 +696,8 @@ class Game:
             
             # Update player
             self.player.handle_input(self.keys, dt)
-            platforms = self.level_manager.get_collision_rects()
+            # Only hand physics the platforms around each entity
+            platforms = self.level_manager.get_collision_rects_near(self.player.get_rect())
             self.player.update(dt, platforms)
             
             # Update camera smoothly
@@ -708,7 +709,8 @@ class Game:
             for enemy in self.enemies[:]:
                 # Only update enemies within reasonable distance
                 if abs(enemy.x - self.player.x) < 800:
-                    enemy.update(dt, self.player, platforms)
+                    enemy_platforms = self.level_manager.get_collision_rects_near(enemy.get_rect())
+                    enemy.update(dt, self.player, enemy_platforms)
                 
                 # Combat
                 if self.player.attacking:
@@ -813,7 +813,8 @@ class LightweightReserkaGothic:
         elif self.state == GameState.PLAYING and self.player:
             # Simple player update
             self.player.handle_input(self.keys, dt)
-            platforms = self.level_manager.get_collision_rects()
+            # Only hand physics the platforms around each entity
+            platforms = self.level_manager.get_collision_rects_near(self.player.get_rect())
             self.player.update(dt, platforms)
             
             # Update Metroidvania camera
@@ -829,7 +830,8 @@ class LightweightReserkaGothic:
             for enemy in self.enemies[:]:
                 # Cull distant enemies for performance
                 if abs(enemy.x - self.player.x) < 800:
-                    enemy.update(dt, self.player, platforms)
+                    enemy_platforms = self.level_manager.get_collision_rects_near(enemy.get_rect())
+                    enemy.update(dt, self.player, enemy_platforms)
                 
                 # Simple combat
                 if self.player.attacking:
@@ -874,8 +876,8 @@ class LightweightReserkaGothic:
             self.character_selection.draw()
             
         elif self.state in [GameState.PLAYING, GameState.LEVEL_TRANSITION] and self.player:
-            # Get camera position
-            camera_x, camera_y = self.camera.get_render_position()
+            # Camera position for this frame, shared with on-screen checks
+            camera_x, camera_y = self.camera.render_pos
             
             # Simple background
             bg = self.asset_manager.get_environment_background(self.level_manager.current_level)
@@ -890,8 +892,9 @@ class LightweightReserkaGothic:
             self.level_manager.draw_level(self.screen, camera_x, camera_y)
             
             # Enemy rendering with camera
-            for enemy in self.enemies:
-                if self.camera.is_on_screen((enemy.x, enemy.y), (enemy.width, enemy.height)):
+            visible = self.camera.visible_mask([(enemy.x, enemy.y) for enemy in self.enemies])
+            for enemy, on_screen in zip(self.enemies, visible):
+                if on_screen:
                     enemy.draw(self.screen, camera_x)
             
             # Player rendering with camera
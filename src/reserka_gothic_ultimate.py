@@ -1225,7 +1225,8 @@ class UltimateReserkaGothic:
         elif self.state == GameState.PLAYING and self.player:
             # Enhanced player update
             self.player.handle_input(self.keys, dt)
-            platforms = self.level_manager.get_collision_rects()
+            # Only hand physics the platforms around each entity
+            platforms = self.level_manager.get_collision_rects_near(self.player.get_rect())
             self.player.update(dt, platforms)
             
             # Update graphics enhancer effects
@@ -1250,7 +1251,8 @@ class UltimateReserkaGothic:
             for enemy in self.enemies[:]:
                 # Cull distant enemies for performance
                 if abs(enemy.x - self.player.x) < 1000:
-                    enemy.update(dt, self.player, platforms)
+                    enemy_platforms = self.level_manager.get_collision_rects_near(enemy.get_rect())
+                    enemy.update(dt, self.player, enemy_platforms)
                 
                 # Enhanced combat
                 if self.player.attacking: